@@ -70,9 +70,9 @@ def check_quote_repository():
 
     try:
         from src.data.models import QuoteCategory
-        from src.data.repository import QuoteRepository
+        from src.data.repository import get_repository
 
-        repo = QuoteRepository()
+        repo = get_repository()
 
         # Check quotes directory
         print(f"  [i] Quotes dir: {repo._quotes_dir}")
@@ -101,9 +101,9 @@ def check_daily_bundle():
     print("\n📅 Checking daily bundle...")
 
     try:
-        from src.data.repository import QuoteRepository
+        from src.data.repository import get_repository
 
-        repo = QuoteRepository()
+        repo = get_repository()
         bundle = repo.get_daily_bundle(date.today())
 
         print(f"  ✅ Bundle date: {bundle.date}")
@@ -130,9 +130,9 @@ def check_formatting():
             build_source_keyboard,
             format_quote,
         )
-        from src.data.repository import QuoteRepository
+        from src.data.repository import get_repository
 
-        repo = QuoteRepository()
+        repo = get_repository()
         bundle = repo.get_daily_bundle(date.today())
 
         for quote in bundle.quotes:
@@ -17,13 +17,12 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from telegram import Bot, BotCommand
+from telegram import Bot
 
-# Only these two commands - simple and fast
-BOT_COMMANDS = [
-    BotCommand("start", "הרשמה לציטוטים יומיים"),
-    BotCommand("today", "ציטוטים של היום"),
-]
+# Same command list the running bot registers on startup
+from src.bot.main import BOT_COMMANDS
+
+COMMAND_NAMES = tuple(c.command for c in BOT_COMMANDS)
 
 
 async def register_commands():
@@ -31,22 +30,21 @@ async def register_commands():
     from src.utils.config import get_settings
 
     settings = get_settings()
-    bot = Bot(token=settings.telegram_bot_token.get_secret_value())
 
     print("🔄 Registering commands with Telegram...")
-    print(f"   Commands to register: {[c.command for c in BOT_COMMANDS]}")
+    print(f"   Commands to register: {list(COMMAND_NAMES)}")
 
     try:
-        # Clear existing commands first
-        await bot.delete_my_commands()
-        print("   ✓ Cleared old commands")
+        # One initialized bot keeps a single keep-alive connection for all calls
+        async with Bot(token=settings.telegram_bot_token.get_secret_value()) as bot:
+            # setMyCommands replaces the whole list for the default scope,
+            # so there's no need to delete the old commands first
+            await bot.set_my_commands(BOT_COMMANDS)
+            print("   ✓ Registered new commands")
 
-        # Set new commands
-        await bot.set_my_commands(BOT_COMMANDS)
-        print("   ✓ Registered new commands")
+            # Verify
+            commands = await bot.get_my_commands()
 
-        # Verify
-        commands = await bot.get_my_commands()
         print(f"\n✅ Bot now has {len(commands)} commands:")
         for cmd in commands:
             print(f"   /{cmd.command} - {cmd.description}")
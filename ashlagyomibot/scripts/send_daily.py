@@ -22,8 +22,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from telegram import Bot
-
+from src.bot.broadcaster import create_rate_limited_bot
 from src.bot.scheduler import send_daily_quotes
 from src.utils.config import get_settings
 from src.utils.logger import get_logger, setup_logging
@@ -42,11 +41,12 @@ async def main() -> int:
         dry_run=settings.dry_run,
     )
 
-    # Create bot instance
-    bot = Bot(token=settings.telegram_bot_token.get_secret_value())
-
-    # Send the daily quotes
-    success = await send_daily_quotes(bot, settings.telegram_chat_id)
+    # Create bot instance (closes its HTTP connection pool on exit); it
+    # retries after Telegram's flood-wait instead of dropping the message
+    token = settings.telegram_bot_token.get_secret_value()
+    async with create_rate_limited_bot(token) as bot:
+        # Send the daily quotes
+        success = await send_daily_quotes(bot, settings.telegram_chat_id)
 
     if success:
         logger.info("daily_send_completed")
@@ -65,7 +65,7 @@ async def send_test_message() -> bool:
         await bot.send_message(
             chat_id=settings.telegram_chat_id,
             text=message,
-            parse_mode="Markdown",
+            parse_mode="HTML",
             disable_web_page_preview=True,
         )
         print(f"✅ Test message sent to {settings.telegram_chat_id}")
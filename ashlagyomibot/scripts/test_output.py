@@ -18,29 +18,27 @@ from src.data.models import Quote
 from src.data.quote_repository import get_quote_repository
 
 
-def format_quote_for_console(quote: Quote) -> str:
-    """Format a quote for console display."""
-    # Build title from source book and section
-    title_parts = []
-    if quote.source_book:
-        title_parts.append(quote.source_book)
-    if quote.source_section:
-        title_parts.append(quote.source_section)
-
-    title = ", ".join(title_parts) if title_parts else quote.source_rabbi
+def quote_title(quote: Quote) -> str:
+    """Build the message title from source book and section."""
+    title_parts = [part for part in (quote.source_book, quote.source_section) if part]
+    return ", ".join(title_parts) if title_parts else quote.source_rabbi
 
-    output = []
-    output.append("=" * 60)
-    output.append(f"📖 {title}")
-    output.append("")
-    output.append(quote.text)
-    output.append("")
-    output.append(f"— {quote.source_rabbi}")
-    output.append("")
-    output.append(f"🔗 Source: {quote.source_url}")
-    output.append("=" * 60)
 
-    return "\n".join(output)
+def format_quote_for_console(quote: Quote) -> str:
+    """Format a quote for console display."""
+    return "\n".join(
+        [
+            "=" * 60,
+            f"📖 {quote_title(quote)}",
+            "",
+            quote.text,
+            "",
+            f"— {quote.source_rabbi}",
+            "",
+            f"🔗 Source: {quote.source_url}",
+            "=" * 60,
+        ]
+    )
 
 
 def main():
@@ -80,14 +78,7 @@ def main():
     print("═══════════════════\n")
 
     for quote in quotes:
-        title_parts = []
-        if quote.source_book:
-            title_parts.append(quote.source_book)
-        if quote.source_section:
-            title_parts.append(quote.source_section)
-        title = ", ".join(title_parts) if title_parts else quote.source_rabbi
-
-        print(f"📖 {title}")
+        print(f"📖 {quote_title(quote)}")
         print()
         print(quote.text)
         print()
@@ -4,6 +4,7 @@ Telegram bot module for Ashlag Yomi.
 This package contains:
 - main: Bot entry point and application setup
 - handlers: Command handlers (/start, /today, etc.)
+- payload: Rendered daily messages shared by /today and broadcasts
 - formatters: Message formatting utilities
 - rate_limit: Rate limiting for commands
 - broadcaster: Channel broadcasting
@@ -17,6 +18,7 @@ __all__ = [
     "formatters",
     "handlers",
     "main",
+    "payload",
     "rate_limit",
     "scheduler",
 ]
@@ -8,65 +8,72 @@ Sends 2 quotes daily (Baal Hasulam + Rabash) with:
 """
 
 import asyncio
+from contextlib import AsyncExitStack
 from datetime import date
 
-from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Bot
+from telegram.ext import AIORateLimiter, ExtBot
+from telegram.request import HTTPXRequest
 
-from src.data.models import Quote
-from src.data.quote_repository import get_quote_repository
+from src.bot.payload import build_daily_payload
 from src.utils.config import get_settings
+from src.utils.dates import israel_today
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Delay between messages to avoid Telegram rate limits
+# Delay between messages to avoid Telegram rate limits.
+# Broadcasts target a single channel where message order matters, so sends
+# stay sequential rather than being fanned out concurrently.
 MESSAGE_DELAY = 0.5
 
+# HTTP timeouts (seconds) for Bot API calls; the library default of 5s is
+# tight for long Hebrew messages on a slow link
+SEND_TIMEOUT = 20.0
+CONNECT_TIMEOUT = 10.0
 
-def format_quote_message(quote: Quote) -> str:
+
+def create_rate_limited_bot(token: str) -> ExtBot:  # type: ignore[type-arg]
     """
-    Format a quote for Telegram channel broadcast.
+    Create a standalone bot that paces its own requests.
+
+    Used for one-off sends outside the running application, with the same
+    timeouts as the application's bot. The rate limiter waits out Telegram's
+    retry_after (pausing every request, not just the one that was rejected)
+    and retries instead of failing the send.
 
     Args:
-        quote: The quote to format
+        token: Bot token from @BotFather
 
     Returns:
-        Formatted HTML string
+        Bot to use as an async context manager.
     """
-    # Build title from source book and section
-    title_parts = []
-    if quote.source_book:
-        title_parts.append(quote.source_book)
-    if quote.source_section:
-        title_parts.append(quote.source_section)
-
-    title = ", ".join(title_parts) if title_parts else quote.source_rabbi
-
-    # Format the message
-    parts = [
-        f"📖 <b>{title}</b>",
-        "",
-        quote.text,
-        "",
-        f"— {quote.source_rabbi}",
-    ]
-
-    return "\n".join(parts)
+    request = HTTPXRequest(
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=SEND_TIMEOUT,
+        write_timeout=SEND_TIMEOUT,
+    )
+    return ExtBot(
+        token=token, request=request, rate_limiter=AIORateLimiter(max_retries=3)
+    )
 
 
-def build_source_keyboard(quote: Quote) -> InlineKeyboardMarkup | None:
-    """Build inline keyboard with source link."""
-    if not quote.source_url:
-        return None
+def needs_manual_pacing(bot: object) -> bool:
+    """
+    Check whether sends through this bot need a fixed delay between them.
 
-    keyboard = [[InlineKeyboardButton(text="📖 מקור מלא", url=quote.source_url)]]
-    return InlineKeyboardMarkup(keyboard)
+    The application's bot already paces every request through its
+    AIORateLimiter (and retries on 429), so sleeping on top of that only
+    adds latency. Bare Bot instances have no limiter and keep the delay.
+    """
+    return not (isinstance(bot, ExtBot) and bot.rate_limiter is not None)
 
 
 async def broadcast_daily_quotes(
     target_date: date | None = None,
     *,
     dry_run: bool = False,
+    bot: Bot | None = None,
 ) -> bool:
     """
     Broadcast today's quotes to the Telegram channel.
@@ -76,12 +83,14 @@ async def broadcast_daily_quotes(
     Args:
         target_date: Date to broadcast for. Defaults to today.
         dry_run: If True, don't actually send messages, just log.
+        bot: Already-initialized bot to send with. If None, a new one is
+            created from the configured token.
 
     Returns:
         True if broadcast was successful, False otherwise.
     """
     if target_date is None:
-        target_date = date.today()
+        target_date = israel_today()
 
     settings = get_settings()
     channel_id = settings.telegram_channel_id
@@ -93,9 +102,9 @@ async def broadcast_daily_quotes(
         )
         return False
 
-    # Get today's quotes
-    repository = get_quote_repository()
-    quotes = repository.get_daily_quotes(target_date)
+    # Get today's quotes, rendered once per date and shared with /today
+    payload = build_daily_payload(target_date)
+    quotes = payload.quotes
 
     if not quotes:
         logger.warning("no_quotes_available_for_broadcast", date=str(target_date))
@@ -121,47 +130,34 @@ async def broadcast_daily_quotes(
 
     # Actually send to Telegram
     try:
-        bot = Bot(token=settings.telegram_bot_token.get_secret_value())
-
-        # Send header
-        date_str = target_date.strftime("%d.%m.%Y")
-        header = f"🌅 <b>אשלג יומי - {date_str}</b>\n\n═══════════════════"
-
-        await bot.send_message(
-            chat_id=channel_id,
-            text=header,
-            parse_mode="HTML",
+        async with AsyncExitStack() as stack:
+            if bot is None:
+                # One-off bot: initialized here and its HTTP pool closed on exit
+                bot = await stack.enter_async_context(
+                    create_rate_limited_bot(
+                        settings.telegram_bot_token.get_secret_value()
+                    )
+                )
+
+            # Send each quote with its source link (header/footer folded in)
+            pace = needs_manual_pacing(bot)
+            for i, (message, keyboard) in enumerate(payload.messages):
+                if i and pace:
+                    await asyncio.sleep(MESSAGE_DELAY)
+
+                await bot.send_message(
+                    chat_id=channel_id,
+                    text=message,
+                    parse_mode="HTML",
+                    reply_markup=keyboard,
+                    disable_web_page_preview=True,
+                )
+
+        logger.info(
+            "broadcast_complete",
+            quote_count=len(quotes),
+            quote_ids=[q.id for q in quotes],
         )
-        await asyncio.sleep(MESSAGE_DELAY)
-
-        # Send each quote
-        for quote in quotes:
-            message = format_quote_message(quote)
-            keyboard = build_source_keyboard(quote)
-
-            await bot.send_message(
-                chat_id=channel_id,
-                text=message,
-                parse_mode="HTML",
-                reply_markup=keyboard,
-                disable_web_page_preview=True,
-            )
-
-            logger.info(
-                "sent_quote",
-                quote_id=quote.id,
-                source=quote.source_rabbi,
-            )
-            await asyncio.sleep(MESSAGE_DELAY)
-
-        # Send footer
-        await bot.send_message(
-            chat_id=channel_id,
-            text="═══════════════════",
-            parse_mode="HTML",
-        )
-
-        logger.info("broadcast_complete", quote_count=len(quotes))
         return True
 
     except Exception as e:
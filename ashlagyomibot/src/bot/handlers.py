@@ -11,74 +11,29 @@ Each quote displays:
 - Clickable source link
 """
 
-import asyncio
-from datetime import date
-
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram import Update
 from telegram.ext import ContextTypes
 
-from src.data.models import Quote
-from src.data.quote_repository import get_quote_repository
+from src.bot.payload import build_daily_payload
 from src.utils.config import get_settings
+from src.utils.dates import israel_today
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Delay between sending messages to avoid Telegram rate limits
-MESSAGE_DELAY = 0.1
-
-
-def format_quote_message(quote: Quote) -> str:
-    """
-    Format a quote for Telegram display.
-
-    Shows:
-    - Title: source_book, source_section
-    - Full text
-    - Source attribution
-
-    Args:
-        quote: The quote to format
-
-    Returns:
-        Formatted HTML string
-    """
-    # Build title from source book and section
-    title_parts = []
-    if quote.source_book:
-        title_parts.append(quote.source_book)
-    if quote.source_section:
-        title_parts.append(quote.source_section)
-
-    title = ", ".join(title_parts) if title_parts else quote.source_rabbi
-
-    # Format the message
-    parts = [
-        f"📖 <b>{title}</b>",
-        "",
-        quote.text,
-        "",
-        f"— {quote.source_rabbi}",
-    ]
-
-    return "\n".join(parts)
+# Static replies, built once at import
+WELCOME_MESSAGE = """🕯️ <b>אשלג יומי</b>
 
+ציטוטים יומיים מבעל הסולם והרב"ש.
 
-def build_source_keyboard(quote: Quote) -> InlineKeyboardMarkup | None:
-    """
-    Build inline keyboard with source link button.
+/today - קבלו את הציטוטים של היום
 
-    Args:
-        quote: The quote to build a keyboard for
+📅 כל יום ב-6:00 בבוקר
+"""
 
-    Returns:
-        InlineKeyboardMarkup with source button, or None if no URL
-    """
-    if not quote.source_url:
-        return None
+NO_QUOTES_MESSAGE = "😔 אין ציטוטים זמינים כרגע."
 
-    keyboard = [[InlineKeyboardButton(text="📖 מקור מלא", url=quote.source_url)]]
-    return InlineKeyboardMarkup(keyboard)
+ERROR_MESSAGE = "😔 אירעה שגיאה. נסו שוב מאוחר יותר."
 
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -90,17 +45,8 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     if not update.effective_message:
         return
 
-    welcome_text = """🕯️ <b>אשלג יומי</b>
-
-ציטוטים יומיים מבעל הסולם והרב"ש.
-
-/today - קבלו את הציטוטים של היום
-
-📅 כל יום ב-6:00 בבוקר
-"""
-
     await update.effective_message.reply_text(
-        welcome_text,
+        WELCOME_MESSAGE,
         parse_mode="HTML",
     )
 
@@ -123,11 +69,11 @@ async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     settings = get_settings()
 
     try:
-        repository = get_quote_repository()
-        quotes = repository.get_daily_quotes()
+        payload = build_daily_payload(israel_today())
+        quotes = payload.quotes
 
         if not quotes:
-            await update.effective_message.reply_text("😔 אין ציטוטים זמינים כרגע.")
+            await update.effective_message.reply_text(NO_QUOTES_MESSAGE)
             return
 
         if settings.dry_run:
@@ -137,18 +83,9 @@ async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             )
             return
 
-        # Send header
-        date_str = date.today().strftime("%d.%m.%Y")
-        header = f"🌅 <b>אשלג יומי - {date_str}</b>\n\n═══════════════════"
-        await update.effective_message.reply_text(header, parse_mode="HTML")
-
-        # Send each quote with source link button
-        for quote in quotes:
-            await asyncio.sleep(MESSAGE_DELAY)
-
-            message = format_quote_message(quote)
-            keyboard = build_source_keyboard(quote)
-
+        # Send each quote with source link button (header/footer folded in).
+        # Pacing is handled by the application's AIORateLimiter.
+        for message, keyboard in payload.messages:
             await update.effective_message.reply_text(
                 message,
                 parse_mode="HTML",
@@ -156,10 +93,6 @@ async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                 disable_web_page_preview=True,
             )
 
-        # Send footer
-        await asyncio.sleep(MESSAGE_DELAY)
-        await update.effective_message.reply_text("═══════════════════")
-
         logger.info(
             "today_command",
             user_id=update.effective_user.id if update.effective_user else None,
@@ -172,4 +105,4 @@ async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             error=str(e),
             user_id=update.effective_user.id if update.effective_user else None,
         )
-        await update.effective_message.reply_text("😔 אירעה שגיאה. נסו שוב מאוחר יותר.")
+        await update.effective_message.reply_text(ERROR_MESSAGE)
@@ -14,27 +14,58 @@ Usage:
 
     # Or via the installed command
     ashlag-yomi
+
+    # Also broadcast to the channel daily from this process
+    ashlag-yomi --daemon
 """
 
+import argparse
 import asyncio
 import signal
 import sys
+from collections import OrderedDict
 from typing import NoReturn
 
 from telegram import BotCommand, Update
-from telegram.ext import Application, CommandHandler, ContextTypes
-
-from src.bot.handlers import start_command, today_command
+from telegram.ext import (
+    AIORateLimiter,
+    Application,
+    ApplicationHandlerStop,
+    CommandHandler,
+    ContextTypes,
+    TypeHandler,
+)
+
+from src.bot.broadcaster import CONNECT_TIMEOUT, SEND_TIMEOUT
+from src.bot.handlers import ERROR_MESSAGE, start_command, today_command
+from src.bot.payload import build_daily_payload
+from src.bot.scheduler import create_broadcast_scheduler
 from src.utils.config import get_settings
+from src.utils.dates import israel_today
 from src.utils.logger import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+# Connections to api.telegram.org. Pins python-telegram-bot's current default
+# (256) so the pool keeps matching concurrent_updates(True), which also
+# handles up to 256 updates at once, if a future release changes the default
+CONNECTION_POOL_SIZE = 256
+
+# Path the webhook server listens on, appended to WEBHOOK_URL
+WEBHOOK_PATH = "telegram"
+
+# How many recent update IDs to remember for dropping redelivered updates
+RECENT_UPDATES_LIMIT = 512
+
+# Recently handled update IDs, oldest first
+_recent_update_ids: OrderedDict[int, None] = OrderedDict()
+
 # Bot commands - only /start and /today
-BOT_COMMANDS = [
+# Built once at import; set_my_commands accepts any sequence
+BOT_COMMANDS = (
     BotCommand("start", "הרשמה לציטוטים יומיים"),
     BotCommand("today", "ציטוטים של היום"),
-]
+)
 
 
 def create_application() -> Application:  # type: ignore[type-arg]
@@ -46,13 +77,25 @@ def create_application() -> Application:  # type: ignore[type-arg]
     """
     settings = get_settings()
 
-    # Build the application with the bot token
+    # Build the application with the bot token. Updates are handled
+    # concurrently so one user's /today doesn't hold up everyone else; the
+    # rate limiter paces all sends against Telegram's limits (and retries
+    # on 429) instead of fixed sleeps in the handlers.
     application = (
         Application.builder()
         .token(settings.telegram_bot_token.get_secret_value())
+        .concurrent_updates(True)
+        .rate_limiter(AIORateLimiter(max_retries=3))
+        .connection_pool_size(CONNECTION_POOL_SIZE)
+        .connect_timeout(CONNECT_TIMEOUT)
+        .read_timeout(SEND_TIMEOUT)
+        .write_timeout(SEND_TIMEOUT)
         .build()
     )
 
+    # Drop redelivered updates before any command handler sees them
+    application.add_handler(TypeHandler(Update, drop_duplicate_updates), group=-1)
+
     # Register command handlers - only /start and /today
     application.add_handler(CommandHandler("start", start_command))
     application.add_handler(CommandHandler("today", today_command))
@@ -74,6 +117,27 @@ async def register_commands(application: Application) -> None:  # type: ignore[t
         logger.error("failed_to_register_commands", error=str(e))
 
 
+async def drop_duplicate_updates(
+    update: Update, _context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """
+    Stop handling an update that was already handled.
+
+    Telegram redelivers a webhook update when it doesn't get a timely
+    response; without this, a retried /today would send every quote twice.
+
+    Raises:
+        ApplicationHandlerStop: If the update ID was seen recently.
+    """
+    if update.update_id in _recent_update_ids:
+        logger.info("duplicate_update_dropped", update_id=update.update_id)
+        raise ApplicationHandlerStop
+
+    _recent_update_ids[update.update_id] = None
+    if len(_recent_update_ids) > RECENT_UPDATES_LIMIT:
+        _recent_update_ids.popitem(last=False)
+
+
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Global error handler for the bot.
@@ -89,21 +153,29 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
     # Send user-friendly error message if we have an update with a message
     if isinstance(update, Update) and update.effective_message:
         try:
-            await update.effective_message.reply_text(
-                "😔 אירעה שגיאה. אנא נסו שוב מאוחר יותר."
-            )
+            await update.effective_message.reply_text(ERROR_MESSAGE)
         except Exception:
             pass  # Don't fail on error message send failure
 
 
-async def run_bot() -> None:
-    """Run the bot in polling mode (for local development)."""
+async def run_bot(*, daemon: bool = False) -> None:
+    """
+    Run the bot, receiving updates by webhook or polling.
+
+    Webhook mode is used when WEBHOOK_URL is set, so Telegram pushes updates
+    instead of the bot holding a long-poll open; otherwise it polls.
+
+    Args:
+        daemon: Also broadcast to the channel daily at the configured send
+            time, reusing this process's bot instead of a cron job.
+    """
     settings = get_settings()
 
     logger.info(
         "starting_bot",
         environment=settings.environment,
         dry_run=settings.dry_run,
+        daemon=daemon,
     )
 
     application = create_application()
@@ -116,13 +188,33 @@ async def run_bot() -> None:
     # Register commands with Telegram
     await register_commands(application)
 
-    logger.info("bot_started", mode="polling")
-
-    # Start polling for updates
-    await application.updater.start_polling(  # type: ignore[union-attr]
-        allowed_updates=Update.ALL_TYPES,
-        drop_pending_updates=True,  # Don't process old messages on restart
-    )
+    # Parse the quote files and render today's messages in a worker thread,
+    # so the first /today doesn't block the event loop on file I/O
+    await asyncio.to_thread(build_daily_payload, israel_today())
+
+    scheduler = create_broadcast_scheduler(application.bot) if daemon else None
+    if scheduler is not None:
+        scheduler.start()
+
+    if settings.webhook_url:
+        secret = settings.webhook_secret_token
+        await application.updater.start_webhook(  # type: ignore[union-attr]
+            listen="0.0.0.0",  # Must be reachable by Telegram
+            port=settings.webhook_port,
+            url_path=WEBHOOK_PATH,
+            webhook_url=f"{settings.webhook_url.rstrip('/')}/{WEBHOOK_PATH}",
+            secret_token=secret.get_secret_value() if secret else None,
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=True,
+        )
+        logger.info("bot_started", mode="webhook")
+    else:
+        # Start polling for updates
+        await application.updater.start_polling(  # type: ignore[union-attr]
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=True,  # Don't process old messages on restart
+        )
+        logger.info("bot_started", mode="polling")
 
     # Keep running until interrupted
     stop_event = asyncio.Event()
@@ -138,6 +230,8 @@ async def run_bot() -> None:
 
     # Graceful shutdown
     logger.info("shutting_down")
+    if scheduler is not None:
+        scheduler.shutdown(wait=False)
     await application.updater.stop()  # type: ignore[union-attr]
     await application.stop()
     await application.shutdown()
@@ -147,10 +241,18 @@ async def run_bot() -> None:
 
 def main() -> NoReturn:
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run the Ashlag Yomi Telegram bot")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Also broadcast to the channel daily at the configured send time",
+    )
+    args = parser.parse_args()
+
     setup_logging()
 
     try:
-        asyncio.run(run_bot())
+        asyncio.run(run_bot(daemon=args.daemon))
     except KeyboardInterrupt:
         logger.info("keyboard_interrupt")
     except Exception as e:
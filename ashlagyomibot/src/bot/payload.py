@@ -0,0 +1,115 @@
+"""
+Rendered daily quote messages for Ashlag Yomi.
+
+Shared by the /today command, the channel broadcaster and the startup
+warmup, so the day's quotes are selected and rendered once per date.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+
+from telegram import InlineKeyboardMarkup
+
+from src.bot.formatters import (
+    DIVIDER,
+    build_source_keyboard,
+    bundle_daily_messages,
+    escape_html,
+    format_daily_header,
+)
+from src.data.models import Quote
+from src.data.quote_repository import get_quote_repository, register_reload_hook
+
+SOURCE_BUTTON_LABEL = "📖 מקור מלא"
+
+
+def format_quote_message(quote: Quote) -> str:
+    """
+    Format a quote for Telegram display.
+
+    Shows:
+    - Title: source_book, source_section
+    - Full text
+    - Source attribution
+
+    Args:
+        quote: The quote to format
+
+    Returns:
+        Formatted HTML string
+    """
+    # Build title from source book and section
+    title_parts = []
+    if quote.source_book:
+        title_parts.append(quote.source_book)
+    if quote.source_section:
+        title_parts.append(quote.source_section)
+
+    title = ", ".join(title_parts) if title_parts else quote.source_rabbi
+
+    # Fixed template, so build it in one f-string (source data is plain
+    # text, so escape it for HTML)
+    return (
+        f"📖 <b>{escape_html(title)}</b>\n\n"
+        f"{escape_html(quote.text)}\n\n"
+        f"— {escape_html(quote.source_rabbi)}"
+    )
+
+
+@dataclass(frozen=True)
+class DailyPayload:
+    """Rendered /today messages for a single day."""
+
+    quotes: tuple[Quote, ...]
+    messages: tuple[tuple[str, InlineKeyboardMarkup | None], ...]
+
+
+@lru_cache(maxsize=1)
+def _render_daily_payload(target_date: date) -> DailyPayload:
+    """Select and render the quotes for a given day (cached per date)."""
+    quotes = tuple(get_quote_repository().get_daily_quotes(target_date))
+
+    messages = bundle_daily_messages(
+        format_daily_header(target_date),
+        [
+            (format_quote_message(q), build_source_keyboard(q, SOURCE_BUTTON_LABEL))
+            for q in quotes
+        ],
+        DIVIDER,
+    )
+
+    return DailyPayload(quotes=quotes, messages=tuple(messages))
+
+
+def build_daily_payload(target_date: date) -> DailyPayload:
+    """
+    Select and render the quotes for a given day.
+
+    The daily selection is deterministic per date, so the rendered header,
+    message HTML and source keyboards are cached and reused by every /today
+    call on the same day. A new date evicts the previous entry. The header
+    and footer are folded into the quote messages where they fit.
+
+    An empty day is not kept cached, so quotes that become available later
+    (or after a repository reload) are picked up on the next call.
+
+    Args:
+        target_date: The date to render quotes for
+
+    Returns:
+        DailyPayload with the day's quotes and their rendered messages
+    """
+    payload = _render_daily_payload(target_date)
+    if not payload.quotes:
+        clear_daily_payload_cache()
+    return payload
+
+
+def clear_daily_payload_cache() -> None:
+    """Drop the rendered daily payload so it is rebuilt on next access."""
+    _render_daily_payload.cache_clear()
+
+
+# Re-render once the underlying quotes are reloaded
+register_reload_hook(clear_daily_payload_cache)
@@ -43,13 +43,17 @@ def is_rate_limited(user_id: int) -> bool:
 
     # Add current request
     recent.append(now)
-    _rate_limits[user_id] = recent
 
-    # Cleanup old users (prevent memory leak)
+    # Cleanup users whose requests have all left the window (prevent memory
+    # leak). Timestamps are appended in order, so the last one is the newest.
     if len(_rate_limits) > 1000:
-        for uid in list(_rate_limits.keys()):
-            if not _rate_limits[uid]:
-                del _rate_limits[uid]
+        stale = [
+            uid
+            for uid, times in _rate_limits.items()
+            if not times or times[-1] <= window_start
+        ]
+        for uid in stale:
+            del _rate_limits[uid]
 
     return False
 
@@ -2,7 +2,8 @@
 Scheduling utilities for daily maamar delivery.
 
 Note: In production, we use GitHub Actions cron jobs instead of
-APScheduler. This module is primarily for local development and testing.
+APScheduler. This module is primarily for local development and testing,
+and for long-running deployments (``ashlag-yomi --daemon``).
 
 Why GitHub Actions over APScheduler for production?
 1. Free tier handles our needs
@@ -12,19 +13,28 @@ Why GitHub Actions over APScheduler for production?
 """
 
 import asyncio
-from datetime import date
-from zoneinfo import ZoneInfo
-
-from src.bot.formatters import build_maamar_keyboard, format_maamar
+from datetime import datetime, timedelta
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from telegram import Bot, InlineKeyboardMarkup
+
+from src.bot.broadcaster import broadcast_daily_quotes, needs_manual_pacing
+from src.bot.formatters import (
+    DIVIDER,
+    build_maamar_keyboard,
+    bundle_daily_messages,
+    format_daily_header,
+    format_maamar,
+)
 from src.data.maamar_repository import get_maamar_repository
+from src.data.models import Maamar
 from src.utils.config import get_settings
+from src.utils.dates import ISRAEL_TZ, israel_today
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Israel timezone for scheduling
-ISRAEL_TZ = ZoneInfo("Asia/Jerusalem")
-
 # Delay between messages to avoid Telegram rate limits
 MESSAGE_DELAY = 0.5
 
@@ -63,23 +73,29 @@ async def send_daily_maamarim(bot: object, chat_id: str) -> bool:
             )
             return True
 
-        # Send header
-        date_str = date.today().strftime("%d.%m.%Y")
-        header = f"🌅 <b>אשלג יומי - {date_str}</b>\n\n═══════════════════"
-        await bot.send_message(  # type: ignore[attr-defined]
-            chat_id=chat_id,
-            text=header,
-            parse_mode="HTML",
-        )
-        await asyncio.sleep(MESSAGE_DELAY)
-
-        # Send each maamar with inline keyboard
+        # Each maamar's messages in order, with its keyboard on the last one
+        today = israel_today()
+        messages: list[tuple[str, InlineKeyboardMarkup | None]] = []
         for maamar in maamarim:
-            messages = format_maamar(maamar)
+            parts = format_maamar(maamar)
             keyboard = build_maamar_keyboard(maamar)
+            messages.extend(
+                (part, keyboard if i == len(parts) - 1 else None)
+                for i, part in enumerate(parts)
+            )
 
-            for i, message in enumerate(messages):
-                reply_markup = keyboard if i == len(messages) - 1 else None
+        # Header and footer ride along with the first and last messages
+        pace = needs_manual_pacing(bot)
+        bundled = bundle_daily_messages(format_daily_header(today), messages, DIVIDER)
+
+        # A maamar counts as delivered once its last message (the one carrying
+        # its keyboard) is sent, so a failure partway through still records
+        # the maamarim that reached the channel
+        delivered: list[Maamar] = []
+        try:
+            for i, (message, reply_markup) in enumerate(bundled):
+                if i and pace:
+                    await asyncio.sleep(MESSAGE_DELAY)
                 await bot.send_message(  # type: ignore[attr-defined]
                     chat_id=chat_id,
                     text=message,
@@ -87,22 +103,18 @@ async def send_daily_maamarim(bot: object, chat_id: str) -> bool:
                     reply_markup=reply_markup,
                     disable_web_page_preview=True,
                 )
-                await asyncio.sleep(MESSAGE_DELAY)
-
-            # Mark as sent for fair rotation
-            repository.mark_as_sent(maamar, date.today())
-
-        # Send footer
-        await bot.send_message(  # type: ignore[attr-defined]
-            chat_id=chat_id,
-            text="═══════════════════",
-        )
+                if reply_markup is not None:
+                    delivered.append(maamarim[len(delivered)])
+        finally:
+            # Mark as sent for fair rotation (one history write for the batch),
+            # off the event loop so other updates keep being served meanwhile
+            await asyncio.to_thread(repository.mark_many_as_sent, delivered, today)
 
         logger.info(
             "daily_maamarim_sent",
             chat_id=chat_id,
             maamar_count=len(maamarim),
-            date=str(date.today()),
+            date=str(today),
         )
 
         return True
@@ -125,12 +137,7 @@ def get_next_send_time() -> str:
     Returns:
         ISO format string of next send time
     """
-    from datetime import datetime, timedelta
-
-    settings = get_settings()
-
-    # Parse send time (HH:MM format)
-    hour, minute = map(int, settings.daily_send_time.split(":"))
+    hour, minute = _parse_send_time()
 
     # Get current time in Israel
     now = datetime.now(ISRAEL_TZ)
@@ -143,3 +150,39 @@ def get_next_send_time() -> str:
         next_send += timedelta(days=1)
 
     return next_send.isoformat()
+
+
+def _parse_send_time() -> tuple[int, int]:
+    """Parse the configured daily send time (HH:MM) into hour and minute."""
+    hour, minute = map(int, get_settings().daily_send_time.split(":"))
+    return hour, minute
+
+
+def create_broadcast_scheduler(bot: Bot) -> AsyncIOScheduler:
+    """
+    Create a scheduler that broadcasts to the channel every day.
+
+    For long-running deployments (instead of the GitHub Actions cron): the
+    same bot, and so the same HTTP connection pool, is reused for every
+    daily send rather than reconnecting each run.
+
+    Args:
+        bot: Initialized bot to send the broadcasts with
+
+    Returns:
+        Scheduler with the daily broadcast job added (not yet started)
+    """
+    hour, minute = _parse_send_time()
+
+    scheduler = AsyncIOScheduler(timezone=ISRAEL_TZ)
+    scheduler.add_job(
+        broadcast_daily_quotes,
+        CronTrigger(hour=hour, minute=minute, timezone=ISRAEL_TZ),
+        kwargs={"bot": bot},
+        id="daily_broadcast",
+        coalesce=True,
+        misfire_grace_time=3600,
+    )
+
+    logger.info("broadcast_scheduled", send_time=f"{hour:02d}:{minute:02d}")
+    return scheduler
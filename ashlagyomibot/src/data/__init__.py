@@ -1,31 +1,58 @@
 """Data layer for Ashlag Yomi - models, repository, and data sources."""
 
-from src.data.maamar_repository import MaamarRepository, get_maamar_repository
-from src.data.models import (
-    DailyBundle,
-    DailyMaamar,
-    Maamar,
-    MaamarCollection,
-    MaamarSentRecord,
-    Quote,
-    QuoteCategory,
-    SourceCategory,
-)
-from src.data.repository import QuoteRepository, get_repository
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Real imports for type checkers and IDEs; at runtime __getattr__ below
+# loads them on first access (the "as" aliases mark them as re-exports)
+if TYPE_CHECKING:
+    from src.data.maamar_repository import MaamarRepository as MaamarRepository
+    from src.data.maamar_repository import (
+        get_maamar_repository as get_maamar_repository,
+    )
+    from src.data.models import DailyBundle as DailyBundle
+    from src.data.models import DailyMaamar as DailyMaamar
+    from src.data.models import Maamar as Maamar
+    from src.data.models import MaamarCollection as MaamarCollection
+    from src.data.models import MaamarSentRecord as MaamarSentRecord
+    from src.data.models import Quote as Quote
+    from src.data.models import QuoteCategory as QuoteCategory
+    from src.data.models import SourceCategory as SourceCategory
+    from src.data.repository import QuoteRepository as QuoteRepository
+    from src.data.repository import get_repository as get_repository
+
+# Exports are resolved lazily (PEP 562) so importing a single submodule such
+# as src.data.models doesn't also load both repositories and the logger.
+_EXPORTS = {
     # New maamar models and repository
-    "DailyMaamar",
-    "Maamar",
-    "MaamarCollection",
-    "MaamarRepository",
-    "MaamarSentRecord",
-    "SourceCategory",
-    "get_maamar_repository",
+    "DailyMaamar": "src.data.models",
+    "Maamar": "src.data.models",
+    "MaamarCollection": "src.data.models",
+    "MaamarRepository": "src.data.maamar_repository",
+    "MaamarSentRecord": "src.data.models",
+    "SourceCategory": "src.data.models",
+    "get_maamar_repository": "src.data.maamar_repository",
     # Legacy quote models (deprecated)
-    "DailyBundle",
-    "Quote",
-    "QuoteCategory",
-    "QuoteRepository",
-    "get_repository",
-]
+    "DailyBundle": "src.data.models",
+    "Quote": "src.data.models",
+    "QuoteCategory": "src.data.models",
+    "QuoteRepository": "src.data.repository",
+    "get_repository": "src.data.repository",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -14,12 +14,13 @@ Design Decisions:
 
 from __future__ import annotations
 
-import json
 import random
 from datetime import date
 from functools import lru_cache
 from pathlib import Path
 
+from pydantic_core import from_json
+
 from src.data.models import (
     DailyMaamar,
     Maamar,
@@ -27,6 +28,7 @@ from src.data.models import (
     MaamarSentRecord,
     SourceCategory,
 )
+from src.utils.files import find_project_root, write_json_atomic
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -67,7 +69,7 @@ class MaamarRepository:
             history_file: File tracking sent maamarim.
                          Defaults to data/maamar_history.json
         """
-        self._project_root = self._find_project_root()
+        self._project_root = find_project_root()
 
         self._maamarim_dir = maamarim_dir or self._project_root / "data" / "maamarim"
         self._history_file = (
@@ -78,20 +80,14 @@ class MaamarRepository:
         self._maamarim_cache: dict[SourceCategory, list[Maamar]] | None = None
         self._history_cache: list[MaamarSentRecord] | None = None
 
+        self._rng = random.Random()
+
         logger.debug(
             "maamar_repository_initialized",
             maamarim_dir=str(self._maamarim_dir),
             history_file=str(self._history_file),
         )
 
-    def _find_project_root(self) -> Path:
-        """Find the project root directory."""
-        current = Path(__file__).resolve()
-        for parent in current.parents:
-            if (parent / "pyproject.toml").exists():
-                return parent
-        return Path.cwd()
-
     def _load_all_maamarim(self) -> dict[SourceCategory, list[Maamar]]:
         """Load all maamarim from JSON cache files."""
         if self._maamarim_cache is not None:
@@ -108,10 +104,10 @@ class MaamarRepository:
 
         for json_file in self._maamarim_dir.glob("*.json"):
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                collection = MaamarCollection.model_validate(data)
+                # Parse and validate in a single pass in pydantic-core
+                collection = MaamarCollection.model_validate_json(
+                    json_file.read_bytes()
+                )
                 maamarim[collection.source] = collection.maamarim
 
                 logger.debug(
@@ -120,7 +116,7 @@ class MaamarRepository:
                     source=collection.source.value,
                     count=len(collection.maamarim),
                 )
-            except (json.JSONDecodeError, ValueError) as e:
+            except ValueError as e:
                 logger.error(
                     "failed_to_load_maamarim",
                     file=json_file.name,
@@ -144,15 +140,14 @@ class MaamarRepository:
             return self._history_cache
 
         try:
-            with open(self._history_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = from_json(self._history_file.read_bytes())
 
             self._history_cache = [
                 MaamarSentRecord.model_validate(record)
                 for record in data.get("sent", [])
             ]
             logger.debug("maamar_history_loaded", count=len(self._history_cache))
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
             logger.error("failed_to_load_maamar_history", error=str(e))
             self._history_cache = []
 
@@ -163,21 +158,17 @@ class MaamarRepository:
         if self._history_cache is None:
             return
 
-        self._history_file.parent.mkdir(parents=True, exist_ok=True)
-
         data = {
             "sent": [record.model_dump(mode="json") for record in self._history_cache]
         }
 
-        with open(self._history_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json_atomic(self._history_file, data)
 
         logger.debug("maamar_history_saved", count=len(self._history_cache))
 
     def get_all_by_source(self, source: SourceCategory) -> list[Maamar]:
         """Get all maamarim for a specific source."""
-        maamarim = self._load_all_maamarim()
-        return maamarim.get(source, [])
+        return self._load_all_maamarim()[source]
 
     def get_all_maamarim(self) -> list[Maamar]:
         """Get all maamarim from all sources."""
@@ -221,7 +212,7 @@ class MaamarRepository:
             logger.info("maamar_rotation_complete", source=source.value)
             available = all_maamarim
 
-        return random.choice(available)
+        return self._rng.choice(available)
 
     def get_random_maamar(self) -> Maamar | None:
         """
@@ -238,7 +229,7 @@ class MaamarRepository:
             logger.warning("no_maamarim_available_for_random")
             return None
 
-        return random.choice(all_maamarim)
+        return self._rng.choice(all_maamarim)
 
     def get_sent_ids_by_source(self, source: SourceCategory) -> set[str]:
         """Get IDs of maamarim that have been sent for a source."""
@@ -247,12 +238,25 @@ class MaamarRepository:
 
     def mark_as_sent(self, maamar: Maamar, sent_date: date) -> None:
         """Record that a maamar was sent."""
+        self.mark_many_as_sent([maamar], sent_date)
+
+    def mark_many_as_sent(self, maamarim: list[Maamar], sent_date: date) -> None:
+        """
+        Record several sent maamarim with a single history write.
+
+        Args:
+            maamarim: Maamarim that were sent
+            sent_date: Date they were sent on
+        """
+        if not maamarim:
+            return
+
         history = self._load_history()
-        record = MaamarSentRecord.from_maamar(maamar, sent_date)
-        history.append(record)
+        history.extend(MaamarSentRecord.from_maamar(m, sent_date) for m in maamarim)
         self._history_cache = history
         self._save_history()
-        logger.info("maamar_marked_sent", maamar_id=maamar.id, date=str(sent_date))
+        for maamar in maamarim:
+            logger.info("maamar_marked_sent", maamar_id=maamar.id, date=str(sent_date))
 
     def get_daily_maamarim(self) -> list[Maamar]:
         """
@@ -263,11 +267,17 @@ class MaamarRepository:
         Returns:
             List of 2 maamarim (one per source), or fewer if unavailable
         """
+        # Group sent IDs by source in one pass over the history, rather than
+        # rescanning it for every source
+        sent_ids: dict[SourceCategory, set[str]] = {s: set() for s in SourceCategory}
+        for record in self._load_history():
+            sent_ids[record.source].add(record.maamar_id)
+
+        pick = self.get_random_by_source
         maamarim: list[Maamar] = []
 
         for source in SourceCategory:
-            sent_ids = self.get_sent_ids_by_source(source)
-            maamar = self.get_random_by_source(source, exclude_ids=sent_ids)
+            maamar = pick(source, exclude_ids=sent_ids[source])
             if maamar:
                 maamarim.append(maamar)
 
@@ -314,7 +324,7 @@ class MaamarRepository:
             "total": sum(len(m) for m in maamarim.values()),
         }
         for source in SourceCategory:
-            stats[source.value] = len(maamarim.get(source, []))
+            stats[source.value] = len(maamarim[source])
 
         return stats
 
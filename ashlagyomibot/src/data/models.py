@@ -38,29 +38,34 @@ class SourceCategory(str, Enum):
     @property
     def display_name_hebrew(self) -> str:
         """Get the Hebrew display name for this source."""
-        names = {
-            SourceCategory.BAAL_HASULAM: "בעל הסולם",
-            SourceCategory.RABASH: 'הרב"ש',
-        }
-        return names[self]
+        return _SOURCE_NAMES_HEBREW[self]
 
     @property
     def display_name_english(self) -> str:
         """Get the English display name for this source."""
-        names = {
-            SourceCategory.BAAL_HASULAM: "Baal HaSulam",
-            SourceCategory.RABASH: "Rabash",
-        }
-        return names[self]
+        return _SOURCE_NAMES_ENGLISH[self]
 
     @property
     def source_website(self) -> str:
         """Get the source website URL for this category."""
-        urls = {
-            SourceCategory.BAAL_HASULAM: "https://search.orhasulam.org/",
-            SourceCategory.RABASH: "https://ashlagbaroch.org/rbsMore/",
-        }
-        return urls[self]
+        return _SOURCE_WEBSITES[self]
+
+
+# Lookup tables are built once at import instead of on every property access
+_SOURCE_NAMES_HEBREW = {
+    SourceCategory.BAAL_HASULAM: "בעל הסולם",
+    SourceCategory.RABASH: 'הרב"ש',
+}
+
+_SOURCE_NAMES_ENGLISH = {
+    SourceCategory.BAAL_HASULAM: "Baal HaSulam",
+    SourceCategory.RABASH: "Rabash",
+}
+
+_SOURCE_WEBSITES = {
+    SourceCategory.BAAL_HASULAM: "https://search.orhasulam.org/",
+    SourceCategory.RABASH: "https://ashlagbaroch.org/rbsMore/",
+}
 
 
 # Keep old QuoteCategory for backward compatibility during migration
@@ -82,28 +87,31 @@ class QuoteCategory(str, Enum):
     @property
     def display_name_hebrew(self) -> str:
         """Get the Hebrew display name for this category."""
-        names = {
-            QuoteCategory.ARIZAL: "האר״י הקדוש",
-            QuoteCategory.BAAL_SHEM_TOV: "הבעל שם טוב",
-            QuoteCategory.POLISH_CHASSIDUT: "חסידות פולין",
-            QuoteCategory.BAAL_HASULAM: "בעל הסולם",
-            QuoteCategory.RABASH: 'הרב"ש',
-            QuoteCategory.CHASDEI_ASHLAG: "חסידי אשלג",
-        }
-        return names[self]
+        return _CATEGORY_NAMES_HEBREW[self]
 
     @property
     def display_name_english(self) -> str:
         """Get the English display name for this category."""
-        names = {
-            QuoteCategory.ARIZAL: "The Holy Arizal",
-            QuoteCategory.BAAL_SHEM_TOV: "The Baal Shem Tov",
-            QuoteCategory.POLISH_CHASSIDUT: "Polish Chassidut",
-            QuoteCategory.BAAL_HASULAM: "Baal HaSulam",
-            QuoteCategory.RABASH: "Rabash",
-            QuoteCategory.CHASDEI_ASHLAG: "Chasdei Ashlag",
-        }
-        return names[self]
+        return _CATEGORY_NAMES_ENGLISH[self]
+
+
+_CATEGORY_NAMES_HEBREW = {
+    QuoteCategory.ARIZAL: "האר״י הקדוש",
+    QuoteCategory.BAAL_SHEM_TOV: "הבעל שם טוב",
+    QuoteCategory.POLISH_CHASSIDUT: "חסידות פולין",
+    QuoteCategory.BAAL_HASULAM: "בעל הסולם",
+    QuoteCategory.RABASH: 'הרב"ש',
+    QuoteCategory.CHASDEI_ASHLAG: "חסידי אשלג",
+}
+
+_CATEGORY_NAMES_ENGLISH = {
+    QuoteCategory.ARIZAL: "The Holy Arizal",
+    QuoteCategory.BAAL_SHEM_TOV: "The Baal Shem Tov",
+    QuoteCategory.POLISH_CHASSIDUT: "Polish Chassidut",
+    QuoteCategory.BAAL_HASULAM: "Baal HaSulam",
+    QuoteCategory.RABASH: "Rabash",
+    QuoteCategory.CHASDEI_ASHLAG: "Chasdei Ashlag",
+}
 
 
 class Quote(BaseModel):
@@ -7,19 +7,35 @@ Uses the existing quote JSON files with random selection capability.
 
 from __future__ import annotations
 
-import json
 import random
+from collections.abc import Callable
 from datetime import date
 from functools import lru_cache
 from pathlib import Path
 
+from pydantic_core import from_json
+
 from src.data.models import Quote, QuoteCategory
+from src.utils.dates import israel_today
+from src.utils.files import find_project_root
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Only these two sources are active
-ACTIVE_CATEGORIES = [QuoteCategory.BAAL_HASULAM, QuoteCategory.RABASH]
+ACTIVE_CATEGORIES = (QuoteCategory.BAAL_HASULAM, QuoteCategory.RABASH)
+
+# Prime (Knuth's multiplicative hash constant) used to spread daily picks
+DAILY_INDEX_MULTIPLIER = 2654435761
+
+# Callbacks run on reload_cache, so caches built from quotes outside this
+# module (e.g. rendered /today messages) are dropped along with the quotes
+_reload_hooks: list[Callable[[], None]] = []
+
+
+def register_reload_hook(hook: Callable[[], None]) -> None:
+    """Run ``hook`` whenever a repository's quote cache is reloaded."""
+    _reload_hooks.append(hook)
 
 
 @lru_cache(maxsize=1)
@@ -29,10 +45,9 @@ def get_quote_repository() -> QuoteRepository:
 
     This avoids re-creating the repository and re-loading quotes
     on every command, significantly improving response time.
+    Quote files are parsed lazily, on first access to each category.
     """
-    repo = QuoteRepository()
-    repo._load_all_quotes()
-    return repo
+    return QuoteRepository()
 
 
 class QuoteRepository:
@@ -50,95 +65,109 @@ class QuoteRepository:
             quotes_dir: Directory containing quote JSON files.
                        Defaults to data/quotes/ in project root.
         """
-        self._project_root = self._find_project_root()
+        self._project_root = find_project_root()
         self._quotes_dir = quotes_dir or self._project_root / "data" / "quotes"
 
-        # Cache for loaded quotes
-        self._quotes_cache: dict[QuoteCategory, list[Quote]] | None = None
+        # Per-category cache, filled on first access to each category. Stored
+        # as tuples so callers can't mutate the cache through a returned list.
+        self._quotes_cache: dict[QuoteCategory, tuple[Quote, ...]] = {}
+
+        # Flat index of every active quote, built once for cross-category picks
+        self._all_quotes: tuple[Quote, ...] | None = None
+
+        # Own RNG for random picks: the repositories don't share state with
+        # the global random module, so seeding or drawing from it elsewhere
+        # doesn't affect which quotes are picked here
+        self._rng = random.Random()
+
+        # Last computed daily selection, keyed by date
+        self._daily_cache: tuple[date, tuple[Quote, ...]] | None = None
 
         logger.debug(
             "quote_repository_initialized",
             quotes_dir=str(self._quotes_dir),
         )
 
-    def _find_project_root(self) -> Path:
-        """Find the project root directory."""
-        current = Path(__file__).resolve()
-        for parent in current.parents:
-            if (parent / "pyproject.toml").exists():
-                return parent
-        return Path.cwd()
-
-    def _load_all_quotes(self) -> dict[QuoteCategory, list[Quote]]:
-        """Load all quotes from JSON files for active categories."""
-        if self._quotes_cache is not None:
-            return self._quotes_cache
+    def _load_category(self, category: QuoteCategory) -> tuple[Quote, ...]:
+        """Load (or return cached) quotes for a single category."""
+        cached = self._quotes_cache.get(category)
+        if cached is not None:
+            return cached
 
-        quotes: dict[QuoteCategory, list[Quote]] = {
-            cat: [] for cat in ACTIVE_CATEGORIES
-        }
+        quotes: list[Quote] = []
+        self._quotes_cache[category] = ()
+
+        json_file = self._quotes_dir / f"{category.value}.json"
+        try:
+            # Open directly instead of stat-ing the dir and file first; the
+            # missing-file case is rare, so only it pays for the extra check
+            raw = json_file.read_bytes()
+        except FileNotFoundError:
+            if not self._quotes_dir.exists():
+                logger.warning("quotes_dir_not_found", path=str(self._quotes_dir))
+            else:
+                logger.warning("quote_file_not_found", file=str(json_file))
+            return ()
+
+        try:
+            # pydantic-core's Rust parser reads the raw bytes directly
+            data = from_json(raw)
+
+            # Parse quotes from the JSON structure
+            raw_quotes = data.get("quotes", [])
+            for raw_quote in raw_quotes:
+                try:
+                    quote = Quote.model_validate(raw_quote)
+                    quotes.append(quote)
+                except Exception as e:
+                    logger.warning(
+                        "failed_to_parse_quote",
+                        quote_id=raw_quote.get("id", "unknown"),
+                        error=str(e),
+                    )
+
+            logger.info(
+                "loaded_quotes_file",
+                file=json_file.name,
+                category=category.value,
+                count=len(quotes),
+            )
+        except ValueError as e:
+            logger.error(
+                "failed_to_load_quotes",
+                file=json_file.name,
+                error=str(e),
+            )
 
-        if not self._quotes_dir.exists():
-            logger.warning("quotes_dir_not_found", path=str(self._quotes_dir))
-            self._quotes_cache = quotes
-            return quotes
+        loaded = tuple(quotes)
+        self._quotes_cache[category] = loaded
+        return loaded
 
-        # Load only Baal Hasulam and Rabash
-        for category in ACTIVE_CATEGORIES:
-            json_file = self._quotes_dir / f"{category.value}.json"
-            if not json_file.exists():
-                logger.warning("quote_file_not_found", file=str(json_file))
-                continue
-
-            try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Parse quotes from the JSON structure
-                raw_quotes = data.get("quotes", [])
-                for raw_quote in raw_quotes:
-                    try:
-                        quote = Quote.model_validate(raw_quote)
-                        quotes[category].append(quote)
-                    except Exception as e:
-                        logger.warning(
-                            "failed_to_parse_quote",
-                            quote_id=raw_quote.get("id", "unknown"),
-                            error=str(e),
-                        )
-
-                logger.info(
-                    "loaded_quotes_file",
-                    file=json_file.name,
-                    category=category.value,
-                    count=len(quotes[category]),
-                )
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.error(
-                    "failed_to_load_quotes",
-                    file=json_file.name,
-                    error=str(e),
-                )
-
-        self._quotes_cache = quotes
-
-        total = sum(len(q) for q in quotes.values())
-        logger.info("quotes_loaded", total=total, categories=len(ACTIVE_CATEGORIES))
+    def _load_all_quotes(self) -> dict[QuoteCategory, tuple[Quote, ...]]:
+        """Load all quotes from JSON files for active categories."""
+        return {
+            category: self._load_category(category) for category in ACTIVE_CATEGORIES
+        }
 
-        return quotes
+    def _load_flat_index(self) -> tuple[Quote, ...]:
+        """Return (building on first use) all active quotes as one tuple."""
+        if self._all_quotes is None:
+            self._all_quotes = tuple(
+                quote
+                for category_quotes in self._load_all_quotes().values()
+                for quote in category_quotes
+            )
+        return self._all_quotes
 
     def get_all_quotes(self) -> list[Quote]:
         """Get all quotes from all active sources."""
-        quotes = self._load_all_quotes()
-        all_quotes: list[Quote] = []
-        for category_quotes in quotes.values():
-            all_quotes.extend(category_quotes)
-        return all_quotes
+        return list(self._load_flat_index())
 
     def get_quotes_by_category(self, category: QuoteCategory) -> list[Quote]:
         """Get all quotes for a specific category."""
-        quotes = self._load_all_quotes()
-        return quotes.get(category, [])
+        if category not in ACTIVE_CATEGORIES:
+            return []
+        return list(self._load_category(category))
 
     def get_random_quote(self, category: QuoteCategory | None = None) -> Quote | None:
         """
@@ -150,10 +179,14 @@ class QuoteRepository:
         Returns:
             A random quote, or None if no quotes available.
         """
+        available: tuple[Quote, ...]
         if category:
-            available = self.get_quotes_by_category(category)
+            # Pick straight from the cached tuple; no need for a copy here
+            available = (
+                self._load_category(category) if category in ACTIVE_CATEGORIES else ()
+            )
         else:
-            available = self.get_all_quotes()
+            available = self._load_flat_index()
 
         if not available:
             logger.warning(
@@ -161,14 +194,15 @@ class QuoteRepository:
             )
             return None
 
-        return random.choice(available)
+        return available[self._rng.randrange(len(available))]
 
     def get_daily_quotes(self, target_date: date | None = None) -> list[Quote]:
         """
-        Get today's quotes - one random from Baal Hasulam and one from Rabash.
+        Get today's quotes - one from Baal Hasulam and one from Rabash.
 
-        Uses the date as a seed for consistent daily selection (same quotes
-        throughout the day, different quotes each day).
+        The date picks the index directly (same quotes throughout the day,
+        different quotes each day, no repeats within a category until all of
+        it has been shown). The selection for the most recent date is memoized.
 
         Args:
             target_date: The date to get quotes for. Defaults to today.
@@ -177,20 +211,27 @@ class QuoteRepository:
             List of 2 quotes (one per source), or fewer if unavailable.
         """
         if target_date is None:
-            target_date = date.today()
+            target_date = israel_today()
+
+        if self._daily_cache is not None and self._daily_cache[0] == target_date:
+            return list(self._daily_cache[1])
 
-        # Use date as seed for reproducible daily selection
-        seed = target_date.toordinal()
-        rng = random.Random(seed)
+        # Scramble the day number with a prime multiplier instead of seeding
+        # an RNG: still deterministic, and consecutive days visit every index
+        # of a category once per cycle in a shuffled-looking order
+        day = target_date.toordinal()
 
+        load = self._load_category
         quotes: list[Quote] = []
 
-        for category in ACTIVE_CATEGORIES:
-            category_quotes = self.get_quotes_by_category(category)
+        for offset, category in enumerate(ACTIVE_CATEGORIES):
+            # Categories are known-active here, so skip the membership check
+            category_quotes = load(category)
             if category_quotes:
-                quote = rng.choice(category_quotes)
-                quotes.append(quote)
+                index = ((day + offset) * DAILY_INDEX_MULTIPLIER) % len(category_quotes)
+                quotes.append(category_quotes[index])
 
+        self._daily_cache = (target_date, tuple(quotes))
         return quotes
 
     def get_stats(self) -> dict[str, int]:
@@ -205,12 +246,15 @@ class QuoteRepository:
             "total": sum(len(q) for q in quotes.values()),
         }
         for category in ACTIVE_CATEGORIES:
-            stats[category.value] = len(quotes.get(category, []))
+            stats[category.value] = len(quotes[category])
 
         return stats
 
     def reload_cache(self) -> None:
-        """Force reload of quotes cache from disk."""
-        self._quotes_cache = None
-        self._load_all_quotes()
+        """Drop cached quotes so they are re-read from disk on next access."""
+        self._quotes_cache.clear()
+        self._all_quotes = None
+        self._daily_cache = None
+        for hook in _reload_hooks:
+            hook()
         logger.info("quote_cache_reloaded")
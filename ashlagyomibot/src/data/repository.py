@@ -14,13 +14,15 @@ Design Decisions:
 
 from __future__ import annotations
 
-import json
 import random
 from datetime import date
 from functools import lru_cache
 from pathlib import Path
 
+from pydantic_core import from_json
+
 from src.data.models import DailyBundle, Quote, QuoteCategory, SentRecord
+from src.utils.files import find_project_root, write_json_atomic
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -63,7 +65,7 @@ class QuoteRepository:
                          Defaults to data/sent_history.json
         """
         # Find project root (where pyproject.toml lives)
-        self._project_root = self._find_project_root()
+        self._project_root = find_project_root()
 
         self._quotes_dir = quotes_dir or self._project_root / "data" / "quotes"
         self._history_file = (
@@ -74,21 +76,14 @@ class QuoteRepository:
         self._quotes_cache: dict[QuoteCategory, list[Quote]] | None = None
         self._history_cache: list[SentRecord] | None = None
 
+        self._rng = random.Random()
+
         logger.debug(
             "repository_initialized",
             quotes_dir=str(self._quotes_dir),
             history_file=str(self._history_file),
         )
 
-    def _find_project_root(self) -> Path:
-        """Find the project root directory."""
-        current = Path(__file__).resolve()
-        for parent in current.parents:
-            if (parent / "pyproject.toml").exists():
-                return parent
-        # Fallback to current working directory
-        return Path.cwd()
-
     def _load_quotes(self) -> dict[QuoteCategory, list[Quote]]:
         """Load all quotes from JSON files."""
         if self._quotes_cache is not None:
@@ -102,19 +97,19 @@ class QuoteRepository:
 
         for json_file in self._quotes_dir.glob("*.json"):
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                data = from_json(json_file.read_bytes())
 
-                for quote_data in data.get("quotes", []):
+                raw_quotes = data.get("quotes", [])
+                for quote_data in raw_quotes:
                     quote = Quote.model_validate(quote_data)
                     quotes[quote.category].append(quote)
 
                 logger.debug(
                     "loaded_quotes_file",
                     file=json_file.name,
-                    count=len(data.get("quotes", [])),
+                    count=len(raw_quotes),
                 )
-            except (json.JSONDecodeError, ValueError) as e:
+            except ValueError as e:
                 logger.error("failed_to_load_quotes", file=json_file.name, error=str(e))
 
         self._quotes_cache = quotes
@@ -134,14 +129,13 @@ class QuoteRepository:
             return self._history_cache
 
         try:
-            with open(self._history_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = from_json(self._history_file.read_bytes())
 
             self._history_cache = [
                 SentRecord.model_validate(record) for record in data.get("sent", [])
             ]
             logger.debug("history_loaded", count=len(self._history_cache))
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
             logger.error("failed_to_load_history", error=str(e))
             self._history_cache = []
 
@@ -152,22 +146,18 @@ class QuoteRepository:
         if self._history_cache is None:
             return
 
-        # Ensure directory exists
-        self._history_file.parent.mkdir(parents=True, exist_ok=True)
-
         data = {
             "sent": [record.model_dump(mode="json") for record in self._history_cache]
         }
 
-        with open(self._history_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json_atomic(self._history_file, data)
 
         logger.debug("history_saved", count=len(self._history_cache))
 
     def get_all_by_category(self, category: QuoteCategory) -> list[Quote]:
         """Get all quotes for a specific category."""
-        quotes = self._load_quotes()
-        return quotes.get(category, [])
+        # Every category has an entry (filled in at load), so index directly
+        return self._load_quotes()[category]
 
     def get_random_by_category(
         self,
@@ -203,7 +193,7 @@ class QuoteRepository:
             logger.info("rotation_complete", category=category.value)
             available = all_quotes
 
-        return random.choice(available)
+        return self._rng.choice(available)
 
     def get_random_quote(self) -> Quote | None:
         """
@@ -224,7 +214,7 @@ class QuoteRepository:
             logger.warning("no_quotes_available_for_random")
             return None
 
-        return random.choice(all_quotes)
+        return self._rng.choice(all_quotes)
 
     def get_sent_ids_by_category(self, category: QuoteCategory) -> set[str]:
         """Get IDs of quotes that have been sent for a category."""
@@ -281,7 +271,7 @@ class QuoteRepository:
             "total": sum(len(q) for q in quotes.values()),
         }
         for category in QuoteCategory:
-            stats[category.value] = len(quotes.get(category, []))
+            stats[category.value] = len(quotes[category])
 
         logger.info("validation_complete", **stats)
         return stats
@@ -131,12 +131,14 @@ class BaalHasulamScraper(BaseScraper):
             ["main", "article", "div"], class_=re.compile(r"content|main")
         )
         if content_area:
+            seen_urls = {m["url"] for m in maamarim}
             for link in content_area.find_all("a", href=True):
                 text = link.get_text(strip=True)
                 if text and len(text) > 5 and not text.startswith("http"):
                     href = link["href"]
                     full_url = urljoin(category_url, href)
-                    if full_url not in [m["url"] for m in maamarim]:
+                    if full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         maamarim.append(
                             {
                                 "title": text,
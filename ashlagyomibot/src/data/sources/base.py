@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import random
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -32,6 +33,14 @@ DEFAULT_HEADERS = {
     "Connection": "keep-alive",
 }
 
+# Text-cleaning patterns, compiled once for all scraped pages
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+_SPACES_RE = re.compile(r"[ \t]+")
+_NEWLINE_PADDING_RE = re.compile(r"[ \t]*\n[ \t]*")
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+_SLUG_STRIP_RE = re.compile(r"[^\w\s\u0590-\u05FF]")
+_SLUG_SPACES_RE = re.compile(r"\s+")
+
 
 class BaseScraper(ABC):
     """
@@ -237,16 +246,13 @@ def clean_hebrew_text(text: str) -> str:
     - Remove control characters
     - Preserve Hebrew punctuation
     """
-    import re
-
     # Remove control characters except newlines and tabs
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
+    text = _CONTROL_CHARS_RE.sub("", text)
 
     # Normalize whitespace (preserve single newlines for paragraphs)
-    text = re.sub(r"[ \t]+", " ", text)  # Multiple spaces/tabs to single space
-    text = re.sub(r"\n[ \t]+", "\n", text)  # Remove leading whitespace after newlines
-    text = re.sub(r"[ \t]+\n", "\n", text)  # Remove trailing whitespace before newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)  # Multiple newlines to double newline
+    text = _SPACES_RE.sub(" ", text)  # Multiple spaces/tabs to single space
+    text = _NEWLINE_PADDING_RE.sub("\n", text)  # Whitespace around newlines, one pass
+    text = _EXTRA_NEWLINES_RE.sub("\n\n", text)  # 3+ newlines to double newline
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -274,13 +280,12 @@ def generate_maamar_id(
     Returns:
         Unique maamar ID
     """
-    import re
 
     def slugify(text: str) -> str:
         # Remove non-alphanumeric characters (keep Hebrew)
-        text = re.sub(r"[^\w\s\u0590-\u05FF]", "", text)
+        text = _SLUG_STRIP_RE.sub("", text)
         # Replace spaces with underscores
-        text = re.sub(r"\s+", "_", text)
+        text = _SLUG_SPACES_RE.sub("_", text)
         # Truncate to reasonable length
         return text[:50].strip("_")
 
@@ -18,6 +18,11 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Text-cleaning patterns, compiled once for all extracted pages
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+_PAGE_NUMBER_RE = re.compile(r"^\d+\s*$", re.MULTILINE)
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 @dataclass
 class PDFPage:
@@ -139,11 +144,11 @@ def clean_pdf_text(text: str) -> str:
     - Hebrew punctuation normalization
     """
     # Remove control characters
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
+    text = _CONTROL_CHARS_RE.sub("", text)
 
     # Remove common PDF artifacts (page numbers, headers)
     # Pattern for standalone numbers (likely page numbers)
-    text = re.sub(r"^\d+\s*$", "", text, flags=re.MULTILINE)
+    text = _PAGE_NUMBER_RE.sub("", text)
 
     # Normalize Hebrew quotation marks
     text = text.replace("״", '"')
@@ -166,7 +171,7 @@ def clean_pdf_text(text: str) -> str:
     text = "\n".join(cleaned_lines)
 
     # Final cleanup
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXTRA_NEWLINES_RE.sub("\n\n", text)
     text = text.strip()
 
     return text
@@ -31,6 +31,10 @@ logger = get_logger(__name__)
 # Base URL for Rabash materials
 BASE_URL = "https://ashlagbaroch.org/rbsMore/"
 
+# Link and book-name patterns, compiled once rather than per element
+_PDF_HREF_RE = re.compile(r"\.pdf$", re.IGNORECASE)
+_DOWNLOAD_WORDS_RE = re.compile(r"(להורדה|PDF|קובץ|הורד)", re.IGNORECASE)
+
 
 class RabashScraper(BaseScraper):
     """
@@ -102,8 +106,9 @@ class RabashScraper(BaseScraper):
                 )
 
         # Also look for links in list items or divs with PDF icons
+        seen_urls = {p["url"] for p in pdfs}
         for container in soup.find_all(["li", "div", "p"]):
-            links = container.find_all("a", href=re.compile(r"\.pdf$", re.IGNORECASE))
+            links = container.find_all("a", href=_PDF_HREF_RE)
             for link in links:
                 href = link["href"]
                 text = container.get_text(strip=True)
@@ -111,7 +116,8 @@ class RabashScraper(BaseScraper):
                 filename = href.split("/")[-1]
 
                 # Avoid duplicates
-                if full_url not in [p["url"] for p in pdfs]:
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
                     pdfs.append(
                         {
                             "name": (
@@ -141,7 +147,7 @@ class RabashScraper(BaseScraper):
         if text:
             # Common patterns for book names
             # Remove common prefixes/suffixes
-            cleaned = re.sub(r"(להורדה|PDF|קובץ|הורד)", "", text, flags=re.IGNORECASE)
+            cleaned = _DOWNLOAD_WORDS_RE.sub("", text)
             cleaned = cleaned.strip(" -–—")
             if cleaned:
                 return cleaned
@@ -30,6 +30,11 @@ BOT_USERNAME = "AshlagyomiBot"
 # Rate limiting
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0  # seconds
+BATCH_DELAY = 0.1  # seconds between batch messages
+
+# Header/footer are constant, so they are rendered once at import
+UNIFIED_HEADER = f"{BADGE}\n{'─' * 30}\n\n"
+UNIFIED_FOOTER = f"\n\n{'━' * 30}\n🔗 @{BOT_USERNAME}"
 
 
 def format_for_unified_channel(content: str) -> str:
@@ -41,9 +46,7 @@ def format_for_unified_channel(content: str) -> str:
     Returns:
         Formatted message with header and footer
     """
-    header = f"{BADGE}\n{'─' * 30}\n\n"
-    footer = f"\n\n{'━' * 30}\n🔗 @{BOT_USERNAME}"
-    return f"{header}{content}{footer}"
+    return f"{UNIFIED_HEADER}{content}{UNIFIED_FOOTER}"
 
 
 def is_unified_channel_enabled() -> bool:
@@ -134,7 +137,7 @@ class TorahYomiPublisher:
             else:
                 failed += 1
             # Rate limiting between messages
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(BATCH_DELAY)
 
         return {"success": success, "failed": failed}
 
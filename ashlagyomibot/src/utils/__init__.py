@@ -1,6 +1,17 @@
 """Utility modules for configuration and logging."""
 
 from src.utils.config import Settings, get_settings
+from src.utils.dates import ISRAEL_TZ, israel_today
+from src.utils.files import find_project_root, write_json_atomic
 from src.utils.logger import get_logger, setup_logging
 
-__all__ = ["Settings", "get_logger", "get_settings", "setup_logging"]
+__all__ = [
+    "ISRAEL_TZ",
+    "Settings",
+    "find_project_root",
+    "get_logger",
+    "get_settings",
+    "israel_today",
+    "setup_logging",
+    "write_json_atomic",
+]
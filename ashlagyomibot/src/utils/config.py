@@ -89,6 +89,21 @@ class Settings(BaseSettings):
         description="If True, log messages instead of sending",
     )
 
+    webhook_url: str | None = Field(
+        default=None,
+        description="Public HTTPS base URL for webhook mode (polling if unset)",
+    )
+
+    webhook_port: int = Field(
+        default=8443,
+        description="Local port the webhook server listens on",
+    )
+
+    webhook_secret_token: SecretStr | None = Field(
+        default=None,
+        description="Secret Telegram sends with each webhook request",
+    )
+
     # =========================================================================
     # Computed Properties
     # =========================================================================
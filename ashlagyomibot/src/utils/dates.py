@@ -0,0 +1,17 @@
+"""
+Date helpers for Ashlag Yomi.
+
+The "day" of a daily quote is the Israel calendar day, regardless of the
+timezone of the server or CI runner the bot happens to run on.
+"""
+
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+# Israel timezone, shared by scheduling and daily selection
+ISRAEL_TZ = ZoneInfo("Asia/Jerusalem")
+
+
+def israel_today() -> date:
+    """Return today's date in Israel."""
+    return datetime.now(ISRAEL_TZ).date()
@@ -0,0 +1,74 @@
+"""
+File helpers for Ashlag Yomi.
+
+Atomic writes go through a temporary file in the same directory followed by an
+atomic rename, so readers never observe a half-written JSON file even if
+the process is killed mid-write. The data is synced to disk before the
+rename, and the file keeps its previous permissions.
+"""
+
+import json
+import os
+import stat
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Permissions for files that don't exist yet (mkstemp creates them as 0600)
+DEFAULT_FILE_MODE = 0o644
+
+
+@lru_cache(maxsize=1)
+def find_project_root() -> Path:
+    """
+    Find the project root directory (where pyproject.toml lives).
+
+    Cached: the answer cannot change within a process, so the parent walk
+    and its filesystem checks happen once rather than per repository.
+
+    Returns:
+        Project root, or the current working directory if not found
+    """
+    for parent in Path(__file__).resolve().parents:
+        if (parent / "pyproject.toml").exists():
+            return parent
+    # Fallback to current working directory
+    return Path.cwd()
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Atomically write data as pretty-printed UTF-8 JSON.
+
+    Args:
+        path: Destination file; parent directories are created if needed
+        data: JSON-serializable data
+    """
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = DEFAULT_FILE_MODE
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+    except FileNotFoundError:
+        # Only the first save needs to create the directory
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            # Without this a crash after the rename can leave an empty file
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path = Path(tmp_name)
+        tmp_path.chmod(mode)
+        tmp_path.replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
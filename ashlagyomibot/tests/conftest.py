@@ -11,6 +11,9 @@ Usage in tests:
         assert sample_maamar.title == "..."
 """
 
+import asyncio
+import sys
+from collections.abc import Callable, Iterator
 from datetime import date, datetime
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -30,6 +33,20 @@ from src.data.models import (
 from src.utils.config import get_settings
 
 
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop when it's available (not on Windows)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
 @pytest.fixture(autouse=True, scope="function")
 def clear_settings_cache():
     """Clear settings cache before and after each test."""
@@ -40,12 +57,15 @@ def clear_settings_cache():
 
 @pytest.fixture(autouse=True, scope="function")
 def clear_repository_cache():
-    """Clear maamar repository singleton cache."""
+    """Clear repository singleton and rendered daily payload caches."""
+    from src.bot.payload import clear_daily_payload_cache
     from src.data.maamar_repository import get_maamar_repository
 
     get_maamar_repository.cache_clear()
+    clear_daily_payload_cache()
     yield
     get_maamar_repository.cache_clear()
+    clear_daily_payload_cache()
 
 
 # =============================================================================
@@ -53,9 +73,12 @@ def clear_repository_cache():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_maamar() -> Maamar:
-    """Create a sample maamar for testing."""
+    """Create a sample maamar for testing.
+
+    Session-scoped: Maamar is frozen, so tests can only read it.
+    """
     return Maamar(
         id="baal_hasulam_test_001",
         source=SourceCategory.BAAL_HASULAM,
@@ -69,9 +92,12 @@ def sample_maamar() -> Maamar:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_maamar_rabash() -> Maamar:
-    """Create a sample Rabash maamar for testing."""
+    """Create a sample Rabash maamar for testing.
+
+    Session-scoped: Maamar is frozen, so tests can only read it.
+    """
     return Maamar(
         id="rabash_test_001",
         source=SourceCategory.RABASH,
@@ -112,6 +138,33 @@ def temp_maamarim_dir(tmp_path: Path) -> Path:
     return maamarim_dir
 
 
+@pytest.fixture(scope="session")
+def sample_maamarim_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+    sample_maamar: Maamar,
+    sample_maamar_rabash: Maamar,
+) -> Path:
+    """Maamar cache files for the sample maamarim, written once per session.
+
+    The repository only reads this directory, so every test can share it.
+    """
+    import json
+
+    maamarim_dir = tmp_path_factory.mktemp("maamarim")
+    for maamar in (sample_maamar, sample_maamar_rabash):
+        collection = MaamarCollection(
+            source=maamar.source,
+            maamarim=[maamar],
+            last_updated=datetime(2024, 1, 1, 12, 0, 0),
+        )
+        file_path = maamarim_dir / f"{maamar.source.value}.json"
+        file_path.write_text(
+            json.dumps(collection.model_dump(mode="json"), ensure_ascii=False),
+            encoding="utf-8",
+        )
+    return maamarim_dir
+
+
 @pytest.fixture
 def temp_maamar_history_file(tmp_path: Path) -> Path:
     """Create a temporary file path for maamar sent history."""
@@ -120,28 +173,16 @@ def temp_maamar_history_file(tmp_path: Path) -> Path:
 
 @pytest.fixture
 def mock_maamar_repository(
-    temp_maamarim_dir: Path,
+    sample_maamarim_dir: Path,
     temp_maamar_history_file: Path,
-    sample_maamarim: list[Maamar],
 ) -> MaamarRepository:
-    """Create a maamar repository with temporary storage and sample data."""
-    import json
-
-    # Create maamar collection files by source
-    for source in SourceCategory:
-        source_maamarim = [m for m in sample_maamarim if m.source == source]
-        if source_maamarim:
-            collection = MaamarCollection(
-                source=source,
-                maamarim=source_maamarim,
-                last_updated=datetime.utcnow(),
-            )
-            file_path = temp_maamarim_dir / f"{source.value}.json"
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(collection.model_dump(mode="json"), f, ensure_ascii=False)
+    """Create a maamar repository over the shared sample data.
 
+    Each test gets its own repository and history file, so sends recorded
+    (or caches cleared) in one test don't leak into the next.
+    """
     repo = MaamarRepository(
-        maamarim_dir=temp_maamarim_dir,
+        maamarim_dir=sample_maamarim_dir,
         history_file=temp_maamar_history_file,
     )
     repo._load_all_maamarim()
@@ -153,9 +194,12 @@ def mock_maamar_repository(
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_quote() -> Quote:
-    """Create a sample quote for testing (legacy)."""
+    """Create a sample quote for testing (legacy).
+
+    Session-scoped: Quote is frozen, so tests can only read it.
+    """
     return Quote(
         id="test-quote-001",
         text="הסתכלות בתכלית מביאה את האדם לשלמות",
@@ -221,15 +265,21 @@ def mock_bot() -> MagicMock:
     return bot
 
 
-@pytest.fixture(autouse=True)
-def mock_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture(autouse=True, scope="session")
+def mock_settings() -> Iterator[None]:
     """Set up mock environment variables for testing.
 
     This is autouse=True to ensure all tests have valid env vars
     since Settings requires TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID.
+
+    Session-scoped and read-only: tests that need a different value should
+    override it with the function-scoped ``monkeypatch`` fixture, which
+    restores the session value afterwards.
     """
-    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token_12345")
-    monkeypatch.setenv("TELEGRAM_CHAT_ID", "@test_channel")
-    monkeypatch.setenv("ENVIRONMENT", "development")
-    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
-    monkeypatch.setenv("DRY_RUN", "true")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TELEGRAM_BOT_TOKEN", "test_token_12345")
+        mp.setenv("TELEGRAM_CHAT_ID", "@test_channel")
+        mp.setenv("ENVIRONMENT", "development")
+        mp.setenv("LOG_LEVEL", "DEBUG")
+        mp.setenv("DRY_RUN", "true")
+        yield
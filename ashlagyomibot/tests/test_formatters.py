@@ -2,11 +2,14 @@
 
 from datetime import date
 
+import pytest
+
 from src.bot.formatters import (
     CATEGORY_EMOJI,
     SOURCE_EMOJI,
     build_maamar_keyboard,
     build_source_keyboard,
+    bundle_daily_messages,
     escape_markdown,
     format_daily_bundle,
     format_maamar,
@@ -23,6 +26,20 @@ from src.data.models import DailyBundle, Maamar, Quote, QuoteCategory, SourceCat
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def long_maamar_messages() -> list[str]:
+    """A ~7500 char maamar formatted once; tests only read the messages."""
+    long_maamar = Maamar(
+        id="long_test",
+        source=SourceCategory.BAAL_HASULAM,
+        title="מאמר ארוך",
+        text="טקסט ארוך מאוד. " * 500,
+        book="ספר בדיקה",
+        source_url="https://example.com",
+    )
+    return format_maamar(long_maamar)
+
+
 class TestBuildMaamarKeyboard:
     """Tests for build_maamar_keyboard function."""
 
@@ -84,6 +101,13 @@ class TestSplitHebrewText:
         chunks = split_hebrew_text(text, max_length=20)
         assert len(chunks) > 1
 
+    def test_chunks_preserve_all_words(self) -> None:
+        """Splitting should neither drop nor duplicate any words."""
+        text = "\n\n".join(f"פסקה {i}. " + "מילה " * 40 for i in range(30))
+        chunks = split_hebrew_text(text, max_length=200)
+        assert " ".join(chunks).split() == text.split()
+        assert all(len(chunk) <= 200 for chunk in chunks)
+
 
 class TestFormatMaamarHeader:
     """Tests for format_maamar_header function."""
@@ -135,18 +159,11 @@ class TestFormatMaamar:
         # Our sample maamar is small enough for one message
         assert len(messages) >= 1
 
-    def test_long_maamar_multiple_messages(self) -> None:
+    def test_long_maamar_multiple_messages(
+        self, long_maamar_messages: list[str]
+    ) -> None:
         """Long maamar should be split into multiple messages."""
-        long_maamar = Maamar(
-            id="long_test",
-            source=SourceCategory.BAAL_HASULAM,
-            title="מאמר ארוך",
-            text="טקסט ארוך מאוד. " * 500,  # ~7500 chars
-            book="ספר בדיקה",
-            source_url="https://example.com",
-        )
-        messages = format_maamar(long_maamar)
-        assert len(messages) > 1
+        assert len(long_maamar_messages) > 1
 
     def test_first_message_has_header(self, sample_maamar: Maamar) -> None:
         """First message should include the header."""
@@ -155,19 +172,12 @@ class TestFormatMaamar:
         assert sample_maamar.title in first_message
         assert sample_maamar.source.display_name_hebrew in first_message
 
-    def test_continuation_messages_have_part_number(self) -> None:
+    def test_continuation_messages_have_part_number(
+        self, long_maamar_messages: list[str]
+    ) -> None:
         """Continuation messages should show part X/Y."""
-        long_maamar = Maamar(
-            id="long_test",
-            source=SourceCategory.BAAL_HASULAM,
-            title="מאמר ארוך",
-            text="טקסט ארוך מאוד. " * 500,
-            book="ספר בדיקה",
-            source_url="https://example.com",
-        )
-        messages = format_maamar(long_maamar)
-        if len(messages) > 1:
-            assert "חלק 2/" in messages[1]
+        if len(long_maamar_messages) > 1:
+            assert "חלק 2/" in long_maamar_messages[1]
 
 
 class TestFormatMaamarPreview:
@@ -300,6 +310,29 @@ class TestFormatDailyBundle:
         assert len(messages) >= 3  # header, quote, footer
 
 
+class TestBundleDailyMessages:
+    """Tests for bundle_daily_messages function."""
+
+    def test_folds_header_and_footer(self) -> None:
+        """Header and footer should ride along with the quote messages."""
+        bundled = bundle_daily_messages("H", [("a", None), ("b", None)], "F")
+        assert bundled == [("H\n\na", None), ("b\n\nF", None)]
+
+    def test_keeps_keyboards(self, sample_quote: Quote) -> None:
+        """Each quote message should keep its own source keyboard."""
+        keyboard = build_source_keyboard(sample_quote)
+        bundled = bundle_daily_messages("H", [("a", keyboard)], "F")
+        assert bundled == [("H\n\na\n\nF", keyboard)]
+
+    def test_oversized_message_keeps_separate_header(self) -> None:
+        """Header should be sent on its own when folding would overflow."""
+        long_text = "א" * 3799
+        bundled = bundle_daily_messages("Header", [(long_text, None)], "F")
+        assert bundled[0] == ("Header", None)
+        assert bundled[-1] == ("F", None)
+        assert len(bundled) == 3
+
+
 class TestFormatSingleQuoteMessage:
     """Tests for format_single_quote_message function."""
 
@@ -339,6 +372,11 @@ class TestEscapeHtml:
         text = "שלום עולם"
         assert escape_markdown(text) == text
 
+    def test_plain_text_returned_unchanged(self) -> None:
+        """Text without markup characters should skip the replace chain."""
+        text = "שלום עולם"
+        assert escape_markdown(text) is text
+
 
 class TestBuildSourceKeyboard:
     """Tests for build_source_keyboard function (nachyomi-bot pattern)."""
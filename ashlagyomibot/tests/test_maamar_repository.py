@@ -1,6 +1,7 @@
 """Tests for the maamar repository."""
 
 from datetime import date
+from unittest.mock import patch
 
 from src.data.maamar_repository import MaamarRepository
 from src.data.models import Maamar, SourceCategory
@@ -94,6 +95,25 @@ class TestMaamarRepository:
         )
         assert maamar.id in sent_ids
 
+    def test_mark_many_as_sent_saves_once(
+        self, mock_maamar_repository: MaamarRepository
+    ) -> None:
+        """Marking a batch should record all of it with one history write."""
+        maamarim = mock_maamar_repository.get_daily_maamarim()
+
+        with patch.object(
+            mock_maamar_repository,
+            "_save_history",
+            wraps=mock_maamar_repository._save_history,
+        ) as save:
+            mock_maamar_repository.mark_many_as_sent(maamarim, date(2024, 1, 15))
+
+        save.assert_called_once()
+        for maamar in maamarim:
+            assert maamar.id in mock_maamar_repository.get_sent_ids_by_source(
+                maamar.source
+            )
+
     def test_get_daily_maamarim(self, mock_maamar_repository: MaamarRepository) -> None:
         """Should return one maamar from each source."""
         maamarim = mock_maamar_repository.get_daily_maamarim()
@@ -0,0 +1,134 @@
+"""Tests for the quote repository."""
+
+import json
+import shutil
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.data.models import QuoteCategory
+from src.data.quote_repository import ACTIVE_CATEGORIES, QuoteRepository
+
+
+@pytest.fixture(scope="module")
+def temp_quotes_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a quotes directory with two quotes per active category.
+
+    Module-scoped: written once and only read; tests that change files on
+    disk use ``writable_quotes_dir`` instead.
+    """
+    quotes_dir = tmp_path_factory.mktemp("quotes")
+    for category in ACTIVE_CATEGORIES:
+        quotes = [
+            {
+                "id": f"{category.value}-{i:03d}",
+                "text": f"ציטוט לדוגמא מספר {i} עם מספיק תווים",
+                "source_rabbi": category.display_name_hebrew,
+                "source_book": "ספר",
+                "source_section": f"פרק {i}",
+                "source_url": f"https://example.com/{category.value}/{i}",
+                "category": category.value,
+            }
+            for i in range(2)
+        ]
+        file_path = quotes_dir / f"{category.value}.json"
+        file_path.write_text(json.dumps({"quotes": quotes}), encoding="utf-8")
+    return quotes_dir
+
+
+@pytest.fixture
+def writable_quotes_dir(temp_quotes_dir: Path, tmp_path: Path) -> Path:
+    """Private copy of the quotes directory for tests that modify it."""
+    return Path(shutil.copytree(temp_quotes_dir, tmp_path / "quotes"))
+
+
+class TestQuoteRepository:
+    """Tests for QuoteRepository class."""
+
+    def test_nothing_loaded_until_accessed(self, temp_quotes_dir: Path) -> None:
+        """Quote files should not be parsed at construction time."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        assert repo._quotes_cache == {}
+
+    def test_loads_only_requested_category(self, temp_quotes_dir: Path) -> None:
+        """Accessing one category should not parse the other files."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        quotes = repo.get_quotes_by_category(QuoteCategory.RABASH)
+        assert len(quotes) == 2
+        assert list(repo._quotes_cache) == [QuoteCategory.RABASH]
+
+    def test_returned_lists_do_not_alias_cache(self, temp_quotes_dir: Path) -> None:
+        """Mutating a returned list should not change the cached quotes."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        repo.get_quotes_by_category(QuoteCategory.RABASH).clear()
+        repo.get_daily_quotes(date(2024, 1, 15)).clear()
+
+        assert len(repo.get_quotes_by_category(QuoteCategory.RABASH)) == 2
+        assert len(repo.get_daily_quotes(date(2024, 1, 15))) == 2
+
+    def test_inactive_category_is_empty(self, temp_quotes_dir: Path) -> None:
+        """Categories outside ACTIVE_CATEGORIES should return no quotes."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        assert repo.get_quotes_by_category(QuoteCategory.ARIZAL) == []
+
+    def test_daily_quotes_one_per_category(self, temp_quotes_dir: Path) -> None:
+        """Daily selection should pick one quote from each active category."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        quotes = repo.get_daily_quotes(date(2024, 1, 15))
+        assert [q.category for q in quotes] == list(ACTIVE_CATEGORIES)
+        assert quotes == repo.get_daily_quotes(date(2024, 1, 15))
+
+    def test_daily_quotes_cover_category_before_repeating(
+        self, temp_quotes_dir: Path
+    ) -> None:
+        """Consecutive days should show every quote once before any repeats."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        start = date(2024, 1, 15).toordinal()
+        ids = {
+            repo.get_daily_quotes(date.fromordinal(start + day))[0].id
+            for day in range(2)
+        }
+        assert len(ids) == 2
+
+    def test_daily_quotes_memoized_per_date(self, temp_quotes_dir: Path) -> None:
+        """Repeat calls for the same date should not redo the selection."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        first = repo.get_daily_quotes(date(2024, 1, 15))
+
+        with patch.object(repo, "_load_category") as load:
+            again = repo.get_daily_quotes(date(2024, 1, 15))
+            load.assert_not_called()
+
+        assert again == first
+        assert again is not first
+
+    def test_flat_index_built_once(self, temp_quotes_dir: Path) -> None:
+        """Cross-category picks should reuse the flat index, not rebuild it."""
+        repo = QuoteRepository(quotes_dir=temp_quotes_dir)
+        assert repo.get_random_quote() is not None
+
+        with patch.object(repo, "_load_all_quotes") as load_all:
+            assert repo.get_random_quote() is not None
+            assert len(repo.get_all_quotes()) == 4
+            load_all.assert_not_called()
+
+    def test_missing_dir_returns_no_quotes(self, tmp_path: Path) -> None:
+        """A missing quotes directory should yield empty results."""
+        repo = QuoteRepository(quotes_dir=tmp_path / "missing")
+        assert repo.get_all_quotes() == []
+        assert repo.get_random_quote() is None
+
+    def test_reload_cache_rereads_files(self, writable_quotes_dir: Path) -> None:
+        """reload_cache should pick up changes on disk."""
+        repo = QuoteRepository(quotes_dir=writable_quotes_dir)
+        assert repo.get_stats()["total"] == 4
+        assert len(repo.get_all_quotes()) == 4
+
+        (writable_quotes_dir / f"{QuoteCategory.RABASH.value}.json").write_text(
+            json.dumps({"quotes": []}), encoding="utf-8"
+        )
+        repo.reload_cache()
+        assert repo.get_stats()["total"] == 2
+        assert len(repo.get_all_quotes()) == 2
@@ -1,157 +1,121 @@
 """Tests for channel broadcaster."""
 
 from datetime import date
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from telegram import Bot
+from telegram.ext import AIORateLimiter, ExtBot
 
-from src.bot.broadcaster import broadcast_daily_maamarim
+from src.bot.broadcaster import (
+    broadcast_daily_maamarim,
+    create_rate_limited_bot,
+    needs_manual_pacing,
+)
+from src.utils.config import get_settings
+
+
+@pytest.fixture
+def daily_quotes(sample_quotes, monkeypatch):
+    """Serve two sample quotes as the day's selection."""
+    quotes = sample_quotes[:2]
+    mock_repo = MagicMock()
+    mock_repo.get_daily_quotes.side_effect = lambda _date: list(quotes)
+    monkeypatch.setattr("src.bot.payload.get_quote_repository", lambda: mock_repo)
+    return quotes
+
+
+@pytest.fixture
+def channel(monkeypatch):
+    """Configure a broadcast channel for live sends."""
+    monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@test_channel")
+    monkeypatch.setenv("DRY_RUN", "false")
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def mock_bot():
+    """Bot whose sends succeed without touching the network."""
+    bot = MagicMock(spec=Bot)
+    bot.send_message = AsyncMock()
+    return bot
 
 
 class TestBroadcastDailyMaamarim:
     """Tests for broadcast_daily_maamarim function."""
 
     @pytest.mark.asyncio
-    async def test_returns_false_without_channel_id(self, mock_settings, monkeypatch):
+    async def test_returns_false_without_channel_id(self, monkeypatch):
         """Should return False when no channel configured."""
         monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "")
 
-        from src.utils.config import get_settings
-
         get_settings.cache_clear()
 
         result = await broadcast_daily_maamarim()
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_dry_run_returns_true(
-        self, mock_settings, sample_maamarim, monkeypatch
-    ):
+    async def test_dry_run_returns_true(self, channel, daily_quotes, mock_bot):
         """Should return True in dry run mode without sending."""
-        monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@test_channel")
-        monkeypatch.setenv("DRY_RUN", "true")
-
-        from src.utils.config import get_settings
-
-        get_settings.cache_clear()
-
-        mock_repo = MagicMock()
-        mock_repo.was_maamar_sent_today.return_value = False
-        mock_repo.get_daily_maamarim.return_value = sample_maamarim
-
-        with patch("src.bot.broadcaster.get_maamar_repository", return_value=mock_repo):
-            result = await broadcast_daily_maamarim(dry_run=True)
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_idempotent_skips_duplicate(self, mock_settings, monkeypatch):
-        """Should skip if already broadcast today."""
-        monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@test_channel")
-        monkeypatch.setenv("DRY_RUN", "false")
-
-        from src.utils.config import get_settings
-
-        get_settings.cache_clear()
-
-        # Mock repository to indicate already broadcast
-        mock_repo = MagicMock()
-        mock_repo.was_maamar_sent_today.return_value = True
-
-        with patch("src.bot.broadcaster.get_maamar_repository", return_value=mock_repo):
-            result = await broadcast_daily_maamarim(target_date=date(2024, 1, 15))
+        result = await broadcast_daily_maamarim(dry_run=True, bot=mock_bot)
 
         assert result is True
-        # Should not have tried to get maamarim since already broadcast
-        mock_repo.get_daily_maamarim.assert_not_called()
+        mock_bot.send_message.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_marks_maamarim_as_sent(
-        self, mock_settings, sample_maamarim, monkeypatch
+    async def test_sends_both_sources(
+        self, channel, daily_quotes, mock_bot, monkeypatch
     ):
-        """Should mark maamarim as sent after successful broadcast."""
-        monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@test_channel")
-        monkeypatch.setenv("DRY_RUN", "false")
-
-        from src.utils.config import get_settings
-
-        get_settings.cache_clear()
-
-        mock_bot = AsyncMock()
-        mock_repo = MagicMock()
-        mock_repo.was_maamar_sent_today.return_value = False
-        mock_repo.get_daily_maamarim.return_value = sample_maamarim
-
-        with (
-            patch("src.bot.broadcaster.get_maamar_repository", return_value=mock_repo),
-            patch("src.bot.broadcaster.Bot", return_value=mock_bot),
-        ):
-            result = await broadcast_daily_maamarim(target_date=date(2024, 1, 15))
+        """Should send one message per quote to the channel."""
+        monkeypatch.setattr("src.bot.broadcaster.MESSAGE_DELAY", 0)
+        result = await broadcast_daily_maamarim(
+            target_date=date(2024, 1, 15), bot=mock_bot
+        )
 
         assert result is True
-        # Should have marked both maamarim as sent
-        assert mock_repo.mark_as_sent.call_count == 2
+        calls = mock_bot.send_message.call_args_list
+        assert len(calls) == len(daily_quotes)
+        for call, quote in zip(calls, daily_quotes, strict=True):
+            assert call.kwargs["chat_id"] == "@test_channel"
+            assert call.kwargs["parse_mode"] == "HTML"
+            assert quote.text in call.kwargs["text"]
 
     @pytest.mark.asyncio
-    async def test_sends_both_sources(
-        self, mock_settings, sample_maamarim, monkeypatch
+    async def test_returns_false_when_no_maamarim(
+        self, channel, daily_quotes, mock_bot
     ):
-        """Should send maamarim from both Baal Hasulam and Rabash."""
-        monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@test_channel")
-        monkeypatch.setenv("DRY_RUN", "false")
-
-        from src.utils.config import get_settings
-
-        get_settings.cache_clear()
+        """Should return False when no quotes available."""
+        daily_quotes.clear()
 
-        mock_bot = AsyncMock()
-        mock_repo = MagicMock()
-        mock_repo.was_maamar_sent_today.return_value = False
-        mock_repo.get_daily_maamarim.return_value = sample_maamarim
+        result = await broadcast_daily_maamarim(bot=mock_bot)
 
-        with (
-            patch("src.bot.broadcaster.get_maamar_repository", return_value=mock_repo),
-            patch("src.bot.broadcaster.Bot", return_value=mock_bot),
-        ):
-            await broadcast_daily_maamarim(target_date=date(2024, 1, 15))
-
-        # Should have called send_message multiple times
-        # (header + maamar messages + footer)
-        assert mock_bot.send_message.call_count >= 3
+        assert result is False
+        mock_bot.send_message.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_returns_false_when_no_maamarim(self, mock_settings, monkeypatch):
-        """Should return False when no maamarim available."""
-        monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@test_channel")
-        monkeypatch.setenv("DRY_RUN", "false")
-
-        from src.utils.config import get_settings
-
-        get_settings.cache_clear()
+    async def test_handles_exceptions_gracefully(self, channel, daily_quotes, mock_bot):
+        """Should handle send errors and return False."""
+        mock_bot.send_message.side_effect = Exception("Test error")
 
-        mock_repo = MagicMock()
-        mock_repo.was_maamar_sent_today.return_value = False
-        mock_repo.get_daily_maamarim.return_value = []
-
-        with patch("src.bot.broadcaster.get_maamar_repository", return_value=mock_repo):
-            result = await broadcast_daily_maamarim()
+        result = await broadcast_daily_maamarim(bot=mock_bot)
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_handles_exceptions_gracefully(self, mock_settings, monkeypatch):
-        """Should handle exceptions and return False."""
-        monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@test_channel")
-        monkeypatch.setenv("DRY_RUN", "false")
 
-        from src.utils.config import get_settings
+class TestNeedsManualPacing:
+    """Tests for needs_manual_pacing."""
 
-        get_settings.cache_clear()
+    def test_plain_bot_is_paced(self):
+        """A bare Bot has no limiter, so sends keep the fixed delay."""
+        assert needs_manual_pacing(Bot(token="123:abc"))
 
-        mock_repo = MagicMock()
-        mock_repo.was_maamar_sent_today.side_effect = Exception("Test error")
+    def test_rate_limited_bot_is_not_paced(self):
+        """The application's rate-limited bot paces itself."""
+        bot = ExtBot(token="123:abc", rate_limiter=AIORateLimiter())
+        assert not needs_manual_pacing(bot)
 
-        with patch("src.bot.broadcaster.get_maamar_repository", return_value=mock_repo):
-            result = await broadcast_daily_maamarim()
-
-        assert result is False
+    def test_standalone_bot_paces_itself(self):
+        """One-off bots should carry their own rate limiter."""
+        bot = create_rate_limited_bot("123:abc")
+        assert isinstance(bot.rate_limiter, AIORateLimiter)
+        assert not needs_manual_pacing(bot)
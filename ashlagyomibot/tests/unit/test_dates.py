@@ -0,0 +1,21 @@
+"""Tests for date helpers."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from src.utils.dates import ISRAEL_TZ, israel_today
+
+
+class TestIsraelToday:
+    """Tests for israel_today function."""
+
+    def test_uses_israel_calendar_day(self) -> None:
+        """Late UTC evening should already be the next day in Israel."""
+        utc_evening = datetime.fromisoformat("2024-01-15T23:30:00+00:00")
+
+        with patch("src.utils.dates.datetime") as mock_datetime:
+            mock_datetime.now.side_effect = utc_evening.astimezone
+            today = israel_today()
+
+        mock_datetime.now.assert_called_once_with(ISRAEL_TZ)
+        assert today.isoformat() == "2024-01-16"
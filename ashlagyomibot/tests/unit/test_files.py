@@ -0,0 +1,60 @@
+"""Tests for file helpers."""
+
+import json
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.files import DEFAULT_FILE_MODE, write_json_atomic
+
+
+class TestWriteJsonAtomic:
+    """Tests for write_json_atomic."""
+
+    def test_writes_json_and_creates_parents(self, tmp_path: Path) -> None:
+        """Should create missing directories and write readable UTF-8 JSON."""
+        path = tmp_path / "nested" / "history.json"
+        write_json_atomic(path, {"sent": ["בעל הסולם"]})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"sent": ["בעל הסולם"]}
+        assert "בעל הסולם" in path.read_text(encoding="utf-8")
+
+    def test_failed_write_keeps_original(self, tmp_path: Path) -> None:
+        """A failure mid-write should leave the old file and no temp files."""
+        path = tmp_path / "history.json"
+        write_json_atomic(path, {"sent": [1]})
+
+        with patch("src.utils.files.json.dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_json_atomic(path, {"sent": [1, 2]})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"sent": [1]}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_new_file_is_world_readable(self, tmp_path: Path) -> None:
+        """A new file should get the default mode, not mkstemp's 0600."""
+        path = tmp_path / "history.json"
+        write_json_atomic(path, {"sent": []})
+
+        assert stat.S_IMODE(path.stat().st_mode) == DEFAULT_FILE_MODE
+
+    def test_keeps_existing_mode(self, tmp_path: Path) -> None:
+        """Rewriting a file should keep its permissions."""
+        path = tmp_path / "history.json"
+        write_json_atomic(path, {"sent": []})
+        path.chmod(0o640)
+
+        write_json_atomic(path, {"sent": [1]})
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_syncs_before_replace(self, tmp_path: Path) -> None:
+        """The data should reach the disk before the rename."""
+        path = tmp_path / "history.json"
+        with patch("src.utils.files.os.fsync", wraps=os.fsync) as fsync:
+            write_json_atomic(path, {"sent": [1]})
+
+        fsync.assert_called_once()
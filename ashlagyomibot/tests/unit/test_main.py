@@ -1,125 +1,110 @@
 """Tests for main bot module."""
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from telegram import BotCommand, Update
+from telegram.ext import (
+    AIORateLimiter,
+    ApplicationHandlerStop,
+    CommandHandler,
+    TypeHandler,
+)
 
+from src.bot.broadcaster import needs_manual_pacing
+from src.bot.handlers import ERROR_MESSAGE
 from src.bot.main import (
     BOT_COMMANDS,
+    CONNECTION_POOL_SIZE,
     create_application,
+    drop_duplicate_updates,
     error_handler,
     register_commands,
 )
-from src.bot.rate_limit import (
-    RATE_LIMIT,
-    RATE_WINDOW,
-    _rate_limits,
-    clear_rate_limits,
-    is_rate_limited,
-)
+
+
+@pytest.fixture(scope="session")
+def command_meta():
+    """(name, description) for each registered command."""
+    return tuple((cmd.command, cmd.description) for cmd in BOT_COMMANDS)
 
 
 class TestBotCommands:
     """Tests for bot command configuration."""
 
-    def test_commands_defined(self):
-        """Should have bot commands defined."""
-        assert len(BOT_COMMANDS) == 6
+    def test_commands_defined(self, command_meta):
+        """Should define only /start and /today."""
+        assert len(command_meta) == 2
 
     def test_commands_are_bot_command_type(self):
         """Commands should be BotCommand instances."""
         for cmd in BOT_COMMANDS:
             assert isinstance(cmd, BotCommand)
 
-    def test_required_commands_present(self):
+    def test_required_commands_present(self, command_meta):
         """Should have all required commands."""
-        command_names = [cmd.command for cmd in BOT_COMMANDS]
-        assert "start" in command_names
-        assert "today" in command_names
-        assert "quote" in command_names
-        assert "about" in command_names
-        assert "help" in command_names
-        assert "feedback" in command_names
-
-    def test_commands_have_descriptions(self):
-        """All commands should have descriptions."""
-        for cmd in BOT_COMMANDS:
-            assert cmd.description
-            assert len(cmd.description) > 0
-
-    def test_descriptions_are_short_english(self):
-        """Command descriptions should be short and in English."""
-        for cmd in BOT_COMMANDS:
-            # Should be under 30 chars (nachyomi-bot pattern)
-            assert len(cmd.description) <= 30
-            # Should be ASCII (English, not Hebrew)
-            assert cmd.description.isascii() or "&" in cmd.description
-
+        command_names = [name for name, _ in command_meta]
+        assert command_names == ["start", "today"]
 
-class TestRateLimiting:
-    """Tests for rate limiting functionality."""
-
-    def setup_method(self):
-        """Clear rate limits before each test."""
-        clear_rate_limits()
-
-    def test_first_request_not_limited(self):
-        """First request should not be rate limited."""
-        assert is_rate_limited(12345) is False
+    def test_commands_have_descriptions(self, command_meta):
+        """All commands should have descriptions."""
+        for _, description in command_meta:
+            assert description
 
-    def test_under_limit_not_limited(self):
-        """Requests under limit should not be rate limited."""
-        user_id = 12345
-        for _ in range(RATE_LIMIT - 1):
-            assert is_rate_limited(user_id) is False
+    def test_descriptions_are_short_hebrew(self, command_meta):
+        """Command descriptions should be short and in Hebrew."""
+        for _, description in command_meta:
+            # Telegram menus truncate long descriptions
+            assert len(description) <= 30
+            # Should contain Hebrew letters
+            assert any("\u0590" <= ch <= "\u05ff" for ch in description)
 
-    def test_at_limit_becomes_limited(self):
-        """Request at limit should be rate limited."""
-        user_id = 12345
-        for _ in range(RATE_LIMIT):
-            is_rate_limited(user_id)
-        # Next request should be limited
-        assert is_rate_limited(user_id) is True
 
-    def test_different_users_independent(self):
-        """Different users should have independent limits."""
-        user1, user2 = 111, 222
+@pytest.fixture(scope="session")
+def built_app(mock_settings):
+    """Build the application once for read-only assertions.
 
-        # Fill up user1's limit
-        for _ in range(RATE_LIMIT):
-            is_rate_limited(user1)
+    Don't use this for tests that add handlers or otherwise mutate the app.
+    """
+    return create_application()
 
-        # User1 should be limited, user2 should not
-        assert is_rate_limited(user1) is True
-        assert is_rate_limited(user2) is False
 
-    def test_old_requests_cleaned_up(self):
-        """Old requests outside window should be cleaned up."""
-        user_id = 12345
+class TestCreateApplication:
+    """Tests for application creation."""
 
-        # Manually add old timestamps
-        old_time = datetime.now() - RATE_WINDOW - timedelta(seconds=1)
-        _rate_limits[user_id] = [old_time] * RATE_LIMIT
+    def test_creates_application(self, built_app):
+        """Should create an Application instance."""
+        assert built_app is not None
 
-        # Should not be rate limited because old requests are cleaned
-        assert is_rate_limited(user_id) is False
+    def test_handles_updates_concurrently(self, built_app):
+        """Updates from different users should not be processed one by one."""
+        assert built_app.concurrent_updates > 1
+        # Each concurrent handler can hold a connection without queueing
+        assert built_app.concurrent_updates <= CONNECTION_POOL_SIZE
 
+    def test_uses_rate_limiter(self, built_app):
+        """Sends should be paced by the application's rate limiter."""
+        assert isinstance(built_app.bot.rate_limiter, AIORateLimiter)
+        # So the scheduled broadcast drops its fixed delay between sends
+        assert not needs_manual_pacing(built_app.bot)
 
-class TestCreateApplication:
-    """Tests for application creation."""
+    def test_registers_handlers(self, built_app):
+        """Should register /start and /today behind the duplicate guard."""
+        commands = built_app.handlers[0]
+        assert all(isinstance(h, CommandHandler) for h in commands)
+        assert [set(h.commands) for h in commands] == [{"start"}, {"today"}]
 
-    def test_creates_application(self, mock_settings):
-        """Should create an Application instance."""
-        app = create_application()
-        assert app is not None
+        (guard,) = built_app.handlers[-1]
+        assert isinstance(guard, TypeHandler)
 
-    def test_registers_handlers(self, mock_settings):
-        """Should register all command handlers."""
-        app = create_application()
-        # Should have 6 handlers (start, today, quote, about, help, feedback)
-        assert len(app.handlers[0]) == 6
+    def test_duplicate_guard_runs_before_commands(self, built_app):
+        """Redelivered updates should be dropped before any command runs."""
+        assert min(built_app.handlers) == -1
+        (guard,) = built_app.handlers[-1]
+        assert guard.callback is drop_duplicate_updates
+        assert guard.type is Update
 
 
 class TestRegisterCommands:
@@ -145,14 +130,38 @@ class TestRegisterCommands:
         await register_commands(mock_app)
 
 
+class TestDropDuplicateUpdates:
+    """Tests for redelivered update filtering."""
+
+    @pytest.mark.asyncio
+    async def test_redelivered_update_is_stopped(self):
+        """A repeated update ID should not reach the command handlers."""
+        update = SimpleNamespace(update_id=987654321)
+
+        await drop_duplicate_updates(update, None)
+        with pytest.raises(ApplicationHandlerStop):
+            await drop_duplicate_updates(update, None)
+
+    @pytest.mark.asyncio
+    async def test_remembers_bounded_number_of_updates(self, monkeypatch):
+        """Old update IDs should be forgotten once the limit is reached."""
+        recent: OrderedDict[int, None] = OrderedDict()
+        monkeypatch.setattr("src.bot.main._recent_update_ids", recent)
+        monkeypatch.setattr("src.bot.main.RECENT_UPDATES_LIMIT", 2)
+
+        for update_id in (1, 2, 3):
+            await drop_duplicate_updates(SimpleNamespace(update_id=update_id), None)
+
+        assert list(recent) == [2, 3]
+
+
 class TestErrorHandler:
     """Tests for global error handler."""
 
     @pytest.mark.asyncio
     async def test_handles_none_update(self):
         """Should handle None update gracefully."""
-        mock_context = MagicMock()
-        mock_context.error = Exception("Test error")
+        mock_context = SimpleNamespace(error=Exception("Test error"))
 
         # Should not raise
         await error_handler(None, mock_context)
@@ -163,8 +172,19 @@ class TestErrorHandler:
         mock_update = MagicMock(spec=Update)
         mock_update.effective_message = None
 
-        mock_context = MagicMock()
-        mock_context.error = Exception("Test error")
+        mock_context = SimpleNamespace(error=Exception("Test error"))
 
         # Should not raise
         await error_handler(mock_update, mock_context)
+
+    @pytest.mark.asyncio
+    async def test_replies_with_shared_error_message(self):
+        """Should reply with the same error text the command handlers use."""
+        mock_update = MagicMock(spec=Update)
+        mock_update.effective_message.reply_text = AsyncMock()
+
+        mock_context = SimpleNamespace(error=Exception("Test error"))
+
+        await error_handler(mock_update, mock_context)
+
+        mock_update.effective_message.reply_text.assert_called_once_with(ERROR_MESSAGE)
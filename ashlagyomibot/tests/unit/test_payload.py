@@ -0,0 +1,47 @@
+"""Tests for the rendered daily payload."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.bot.payload import build_daily_payload
+from src.data.quote_repository import QuoteRepository
+
+
+@pytest.fixture
+def daily_quotes(monkeypatch, sample_quotes):
+    """Serve two sample quotes as the day's selection."""
+    quotes = sample_quotes[:2]
+    repo = MagicMock()
+    repo.get_daily_quotes.return_value = quotes
+    monkeypatch.setattr("src.bot.payload.get_quote_repository", lambda: repo)
+    return quotes
+
+
+class TestBuildDailyPayload:
+    """Tests for the cached /today payload."""
+
+    def test_reuses_payload_for_same_date(self, daily_quotes):
+        """Should render a day's quotes once."""
+        day = date(2024, 1, 15)
+        assert build_daily_payload(day) is build_daily_payload(day)
+
+    def test_does_not_cache_empty_day(self, daily_quotes):
+        """Quotes that appear after an empty lookup should be picked up."""
+        day = date(2024, 1, 15)
+        available = list(daily_quotes)
+        daily_quotes.clear()
+        assert build_daily_payload(day).quotes == ()
+
+        daily_quotes.extend(available)
+        assert build_daily_payload(day).quotes == tuple(available)
+
+    def test_repository_reload_clears_payload(self, daily_quotes, tmp_path):
+        """Reloading the quote cache should re-render the payload."""
+        day = date(2024, 1, 15)
+        stale = build_daily_payload(day)
+
+        QuoteRepository(quotes_dir=tmp_path).reload_cache()
+
+        assert build_daily_payload(day) is not stale
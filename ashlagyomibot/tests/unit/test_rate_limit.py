@@ -0,0 +1,81 @@
+"""Tests for rate limiting.
+
+These tests mutate the module-level ``_rate_limits`` store; the autouse
+fixture below empties it around each test, so test order doesn't matter.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.bot.rate_limit import (
+    RATE_LIMIT,
+    RATE_WINDOW,
+    _rate_limits,
+    clear_rate_limits,
+    is_rate_limited,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_rate_limits():
+    """Start each test with an empty store and leave none behind."""
+    clear_rate_limits()
+    yield
+    clear_rate_limits()
+
+
+class TestRateLimiting:
+    """Tests for rate limiting functionality."""
+
+    def test_first_request_not_limited(self):
+        """First request should not be rate limited."""
+        assert is_rate_limited(12345) is False
+
+    def test_under_limit_not_limited(self):
+        """Requests under limit should not be rate limited."""
+        user_id = 12345
+        recent = datetime.now() - timedelta(seconds=1)
+        _rate_limits[user_id] = [recent] * (RATE_LIMIT - 1)
+
+        assert is_rate_limited(user_id) is False
+
+    def test_at_limit_becomes_limited(self):
+        """Request at limit should be rate limited."""
+        user_id = 12345
+        recent = datetime.now() - timedelta(seconds=1)
+        _rate_limits[user_id] = [recent] * RATE_LIMIT
+
+        assert is_rate_limited(user_id) is True
+
+    def test_different_users_independent(self):
+        """Different users should have independent limits."""
+        user1, user2 = 111, 222
+
+        # Fill up user1's limit
+        for _ in range(RATE_LIMIT):
+            is_rate_limited(user1)
+
+        # User1 should be limited, user2 should not
+        assert is_rate_limited(user1) is True
+        assert is_rate_limited(user2) is False
+
+    def test_old_requests_cleaned_up(self):
+        """Old requests outside window should be cleaned up."""
+        user_id = 12345
+
+        # Manually add old timestamps
+        old_time = datetime.now() - RATE_WINDOW - timedelta(seconds=1)
+        _rate_limits[user_id] = [old_time] * RATE_LIMIT
+
+        # Should not be rate limited because old requests are cleaned
+        assert is_rate_limited(user_id) is False
+
+    def test_idle_users_evicted_when_store_is_large(self):
+        """Users with no requests in the window should be pruned."""
+        old_time = datetime.now() - RATE_WINDOW - timedelta(seconds=1)
+        for uid in range(1001):
+            _rate_limits[uid] = [old_time]
+
+        assert is_rate_limited(99999) is False
+        assert list(_rate_limits) == [99999]
@@ -1,92 +1,174 @@
 """Tests for scheduling utilities."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.bot.scheduler import get_next_send_time, send_daily_quotes
+from src.bot.formatters import DIVIDER
+from src.bot.scheduler import (
+    create_broadcast_scheduler,
+    get_next_send_time,
+    send_daily_maamarim,
+    send_daily_quotes,
+)
+from src.utils.config import Settings
+
+
+@pytest.fixture(scope="session")
+def dry_run_settings() -> Settings:
+    """Settings with dry run enabled, built once per session."""
+    return Settings(
+        telegram_bot_token="test_token_12345",
+        telegram_chat_id="@test_channel",
+        dry_run=True,
+        _env_file=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def live_settings() -> Settings:
+    """Settings with dry run disabled, built once per session."""
+    return Settings(
+        telegram_bot_token="test_token_12345",
+        telegram_chat_id="@test_channel",
+        dry_run=False,
+        _env_file=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_bot():
+    """Create a mock Telegram bot, shared across the module."""
+    bot = MagicMock()
+    bot.send_message = AsyncMock()
+    return bot
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_bot(mock_bot):
+    """Reset the shared bot so call history doesn't leak between tests."""
+    yield
+    mock_bot.send_message.reset_mock()
+
+
+@pytest.fixture
+def daily_repository(mock_maamar_repository, monkeypatch):
+    """Serve the sample maamarim to the scheduler."""
+    monkeypatch.setattr(
+        "src.bot.scheduler.get_maamar_repository", lambda: mock_maamar_repository
+    )
+    return mock_maamar_repository
 
 
 class TestSendDailyQuotes:
-    """Tests for send_daily_quotes function."""
+    """Tests for send_daily_quotes (alias of send_daily_maamarim)."""
 
     @pytest.mark.asyncio
-    async def test_returns_false_when_no_quotes(self, mock_settings):
-        """Should return False when no quotes available."""
-        mock_bot = MagicMock()
+    async def test_returns_false_when_no_quotes(
+        self, mock_bot, live_settings, monkeypatch
+    ):
+        """Should return False when no maamarim are available."""
+        monkeypatch.setattr("src.bot.scheduler.get_settings", lambda: live_settings)
         mock_repo = MagicMock()
-        mock_bundle = MagicMock()
-        mock_bundle.quotes = []
-        mock_repo.get_daily_bundle.return_value = mock_bundle
+        mock_repo.get_daily_maamarim.return_value = []
+        monkeypatch.setattr(
+            "src.bot.scheduler.get_maamar_repository", lambda: mock_repo
+        )
 
-        with patch("src.bot.scheduler.QuoteRepository", return_value=mock_repo):
-            result = await send_daily_quotes(mock_bot, "@test_channel")
+        result = await send_daily_quotes(mock_bot, "@test_channel")
 
         assert result is False
+        mock_bot.send_message.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_dry_run_does_not_send(self, mock_settings, monkeypatch):
+    async def test_dry_run_does_not_send(
+        self, daily_repository, mock_bot, dry_run_settings, monkeypatch
+    ):
         """Should not send messages in dry run mode."""
-        monkeypatch.setenv("DRY_RUN", "true")
-
-        from src.utils.config import get_settings
+        monkeypatch.setattr("src.bot.scheduler.get_settings", lambda: dry_run_settings)
 
-        get_settings.cache_clear()
-
-        mock_bot = MagicMock()
-        mock_bot.send_message = AsyncMock()
-
-        mock_repo = MagicMock()
-        mock_bundle = MagicMock()
-        mock_bundle.quotes = [MagicMock()]
-        mock_repo.get_daily_bundle.return_value = mock_bundle
-
-        with patch("src.bot.scheduler.QuoteRepository", return_value=mock_repo):
-            result = await send_daily_quotes(mock_bot, "@test_channel")
+        result = await send_daily_quotes(mock_bot, "@test_channel")
 
         assert result is True
         mock_bot.send_message.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_sends_messages_in_normal_mode(
-        self, mock_settings, mock_repository, monkeypatch
+        self, daily_repository, mock_bot, live_settings, monkeypatch
     ):
         """Should send messages when not in dry run."""
-        monkeypatch.setenv("DRY_RUN", "false")
-
-        from src.utils.config import get_settings
-
-        get_settings.cache_clear()
+        monkeypatch.setattr("src.bot.scheduler.get_settings", lambda: live_settings)
 
-        mock_bot = MagicMock()
-        mock_bot.send_message = AsyncMock()
-
-        with patch("src.bot.scheduler.QuoteRepository", return_value=mock_repository):
-            result = await send_daily_quotes(mock_bot, "@test_channel")
+        monkeypatch.setattr("src.bot.scheduler.MESSAGE_DELAY", 0)
+        result = await send_daily_quotes(mock_bot, "@test_channel")
 
         assert result is True
         assert mock_bot.send_message.call_count > 0
 
     @pytest.mark.asyncio
     async def test_uses_html_parse_mode(
-        self, mock_settings, mock_repository, monkeypatch
+        self, daily_repository, mock_bot, live_settings, monkeypatch
     ):
         """Should use HTML parse mode."""
-        monkeypatch.setenv("DRY_RUN", "false")
+        monkeypatch.setattr("src.bot.scheduler.get_settings", lambda: live_settings)
+
+        monkeypatch.setattr("src.bot.scheduler.MESSAGE_DELAY", 0)
+        await send_daily_quotes(mock_bot, "@test_channel")
+
+        calls = mock_bot.send_message.call_args_list
+        assert calls
+        for call in calls:
+            assert call.kwargs.get("parse_mode") == "HTML"
 
-        from src.utils.config import get_settings
 
-        get_settings.cache_clear()
+class TestSendDailyMaamarim:
+    """Tests for send_daily_maamarim."""
 
-        mock_bot = MagicMock()
-        mock_bot.send_message = AsyncMock()
+    @pytest.mark.asyncio
+    async def test_folds_header_and_footer_into_maamar_messages(
+        self, mock_maamar_repository, mock_bot, live_settings, monkeypatch
+    ):
+        """Header and footer should not cost API calls of their own."""
+        monkeypatch.setattr("src.bot.scheduler.get_settings", lambda: live_settings)
+        monkeypatch.setattr(
+            "src.bot.scheduler.get_maamar_repository",
+            lambda: mock_maamar_repository,
+        )
 
-        with patch("src.bot.scheduler.QuoteRepository", return_value=mock_repository):
-            await send_daily_quotes(mock_bot, "@test_channel")
+        monkeypatch.setattr("src.bot.scheduler.MESSAGE_DELAY", 0)
+        result = await send_daily_maamarim(mock_bot, "@test_channel")
 
-        for call in mock_bot.send_message.call_args_list:
-            kwargs = call[1]
-            assert kwargs.get("parse_mode") == "HTML"
+        assert result is True
+        texts = [c.kwargs["text"] for c in mock_bot.send_message.call_args_list]
+        assert len(texts) == 2
+        assert texts[0].startswith("🌅")
+        assert texts[-1].endswith(DIVIDER)
+
+    @pytest.mark.asyncio
+    async def test_records_delivered_maamarim_when_send_fails_midway(
+        self, mock_maamar_repository, live_settings, monkeypatch
+    ):
+        """Maamarim already delivered should be recorded even if a later send fails."""
+        monkeypatch.setattr("src.bot.scheduler.get_settings", lambda: live_settings)
+        monkeypatch.setattr(
+            "src.bot.scheduler.get_maamar_repository",
+            lambda: mock_maamar_repository,
+        )
+        first, second = mock_maamar_repository.get_daily_maamarim()
+        monkeypatch.setattr(
+            mock_maamar_repository, "get_daily_maamarim", lambda: [first, second]
+        )
+        bot = MagicMock()
+        bot.send_message = AsyncMock(side_effect=[None, TimeoutError("network")])
+
+        monkeypatch.setattr("src.bot.scheduler.MESSAGE_DELAY", 0)
+        result = await send_daily_maamarim(bot, "@test_channel")
+
+        assert result is False
+        assert first.id in mock_maamar_repository.get_sent_ids_by_source(first.source)
+        assert second.id not in mock_maamar_repository.get_sent_ids_by_source(
+            second.source
+        )
 
 
 class TestGetNextSendTime:
@@ -115,3 +197,19 @@ class TestGetNextSendTime:
         # Should be in the future (or at least not in the past)
         now = datetime.now(ZoneInfo("Asia/Jerusalem"))
         assert next_time >= now.replace(second=0, microsecond=0)
+
+
+class TestCreateBroadcastScheduler:
+    """Tests for create_broadcast_scheduler function."""
+
+    def test_schedules_daily_broadcast_at_send_time(self, mock_settings, mock_bot):
+        """Should add one cron job at the configured Israel send time."""
+        scheduler = create_broadcast_scheduler(mock_bot)
+
+        job = scheduler.get_job("daily_broadcast")
+        assert job is not None
+        assert job.kwargs == {"bot": mock_bot}
+
+        fields = {f.name: str(f) for f in job.trigger.fields}
+        assert (fields["hour"], fields["minute"]) == ("6", "0")
+        assert str(job.trigger.timezone) == "Asia/Jerusalem"
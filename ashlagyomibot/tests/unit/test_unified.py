@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from telegram.error import TelegramError
 
 from src.unified.publisher import (
     BADGE,
@@ -13,6 +14,28 @@ from src.unified.publisher import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip retry and rate-limit delays."""
+    monkeypatch.setattr("src.unified.publisher.RETRY_DELAY", 0)
+    monkeypatch.setattr("src.unified.publisher.BATCH_DELAY", 0)
+
+
+@pytest.fixture(scope="module")
+def asyncmock_bot():
+    """Create a mock Telegram bot, shared across the module."""
+    bot = MagicMock()
+    bot.send_message = AsyncMock()
+    return bot
+
+
+@pytest.fixture(autouse=True)
+def reset_asyncmock_bot(asyncmock_bot):
+    """Reset call history and any configured side effects between tests."""
+    yield
+    asyncmock_bot.send_message.reset_mock(return_value=True, side_effect=True)
+
+
 class TestFormatForUnifiedChannel:
     """Tests for format_for_unified_channel function."""
 
@@ -83,11 +106,8 @@ class TestTorahYomiPublisher:
             assert result is False
 
     @pytest.mark.asyncio
-    async def test_publish_text_success(self):
+    async def test_publish_text_success(self, asyncmock_bot):
         """Should return True on successful publish."""
-        mock_bot = MagicMock()
-        mock_bot.send_message = AsyncMock()
-
         with (
             patch(
                 "src.unified.publisher.is_unified_channel_enabled", return_value=True
@@ -95,56 +115,46 @@ class TestTorahYomiPublisher:
             patch("src.unified.publisher.UNIFIED_CHANNEL_ID", "@test_channel"),
         ):
             publisher = TorahYomiPublisher()
-            publisher._bot = mock_bot
+            publisher._bot = asyncmock_bot
             result = await publisher.publish_text("Test content")
             assert result is True
-            mock_bot.send_message.assert_called_once()
+            asyncmock_bot.send_message.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_publish_text_retries_on_error(self):
+    async def test_publish_text_retries_on_error(self, asyncmock_bot):
         """Should retry on error."""
-        mock_bot = MagicMock()
         # Fail twice, succeed third time
-        from telegram.error import TelegramError
-
-        mock_bot.send_message = AsyncMock(
-            side_effect=[
-                TelegramError("Error 1"),
-                TelegramError("Error 2"),
-                None,  # Success
-            ]
-        )
+        asyncmock_bot.send_message.side_effect = [
+            TelegramError("Error 1"),
+            TelegramError("Error 2"),
+            None,  # Success
+        ]
 
         with (
             patch(
                 "src.unified.publisher.is_unified_channel_enabled", return_value=True
             ),
             patch("src.unified.publisher.UNIFIED_CHANNEL_ID", "@test_channel"),
-            patch("src.unified.publisher.RETRY_DELAY", 0.001),  # Fast retries for tests
         ):
             publisher = TorahYomiPublisher()
-            publisher._bot = mock_bot
+            publisher._bot = asyncmock_bot
             result = await publisher.publish_text("Test")
             assert result is True
-            assert mock_bot.send_message.call_count == 3
+            assert asyncmock_bot.send_message.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_publish_text_fails_after_max_retries(self):
+    async def test_publish_text_fails_after_max_retries(self, asyncmock_bot):
         """Should return False after max retries exceeded."""
-        mock_bot = MagicMock()
-        from telegram.error import TelegramError
-
-        mock_bot.send_message = AsyncMock(side_effect=TelegramError("Persistent error"))
+        asyncmock_bot.send_message.side_effect = TelegramError("Persistent error")
 
         with (
             patch(
                 "src.unified.publisher.is_unified_channel_enabled", return_value=True
             ),
             patch("src.unified.publisher.UNIFIED_CHANNEL_ID", "@test_channel"),
-            patch("src.unified.publisher.RETRY_DELAY", 0.001),
         ):
             publisher = TorahYomiPublisher()
-            publisher._bot = mock_bot
+            publisher._bot = asyncmock_bot
             result = await publisher.publish_text("Test")
             assert result is False
 
@@ -158,31 +168,23 @@ class TestTorahYomiPublisher:
             result = await publisher.publish_batch(["msg1", "msg2"])
             assert result == {"success": 0, "failed": 0}
 
+    @pytest.mark.parametrize(
+        ("results", "expected"),
+        [
+            ([True, True], {"success": 2, "failed": 0}),
+            ([True, False], {"success": 1, "failed": 1}),
+            ([False, False], {"success": 0, "failed": 2}),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_publish_batch_counts(self):
+    async def test_publish_batch_counts(self, results, expected):
         """Should return correct success/failed counts."""
-        mock_bot = MagicMock()
-        # First succeeds, second fails
-        from telegram.error import TelegramError
-
-        mock_bot.send_message = AsyncMock(
-            side_effect=[
-                None,  # Success
-                TelegramError("Error"),
-                TelegramError("Error"),
-                TelegramError("Error"),  # 3 retries
-            ]
-        )
-
-        with (
-            patch(
-                "src.unified.publisher.is_unified_channel_enabled", return_value=True
-            ),
-            patch("src.unified.publisher.UNIFIED_CHANNEL_ID", "@test_channel"),
-            patch("src.unified.publisher.RETRY_DELAY", 0.001),
+        with patch(
+            "src.unified.publisher.is_unified_channel_enabled", return_value=True
         ):
             publisher = TorahYomiPublisher()
-            publisher._bot = mock_bot
-            result = await publisher.publish_batch(["msg1", "msg2"])
-            assert result["success"] == 1
-            assert result["failed"] == 1
+            with patch.object(
+                publisher, "publish_text", AsyncMock(side_effect=results)
+            ):
+                result = await publisher.publish_batch(["msg1", "msg2"])
+            assert result == expected